@@ -0,0 +1,73 @@
+"""
+Website crawl throughput on a synthetic local site.
+
+Every page links to the next five pages and to one pseudo-random page, plus
+fragment variants of them and an external link, so the crawl reaches every
+page and has to deduplicate most of the links it parses.
+
+    python -m benchmarks.crawl --pages 10000 --latency 0.005 --concurrency 8 32
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import random
+import time
+
+from benchmarks.stub import StubHandler, StubServer
+from modules.network.url import UrlScanner
+from utils.storage import VISITED_STORES
+
+
+class SiteHandler(StubHandler):
+    def page(self, number: int) -> bytes:
+        pages, port = self.server.pages, self.server.server_address[1]
+        rng = random.Random(number)
+        links = [(number * 5 + step) % pages for step in range(1, 6)] + [rng.randrange(pages)]
+
+        body = [f"<html><head><title>Page {number}</title></head><body>"]
+        for link in links:
+            body.append(
+                f'<a href="/p/{link}">{link}</a><a href="/p/{link}/#comments">comments</a>'
+                f'<a href="/p/{link}#top">top</a><a href="http://example.test/?ref=127.0.0.1:{port}">share</a>'
+                f'<p>{"x" * 200}</p>'
+            )
+        body.append("</body></html>")
+        return "".join(body).encode()
+
+    def do_GET(self) -> None:
+        path = self.path.split("#", 1)[0].rstrip("/")
+        number = path.removeprefix("/p/") if path.startswith("/p/") else "0" if path == "" else None
+        if number is None or not number.isdigit() or int(number) >= self.server.pages:
+            self.send_body(404, b"")
+            return
+
+        if self.server.latency:
+            time.sleep(self.server.latency)
+        self.send_body(200, self.page(int(number)))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--pages", type=int, default=10_000, help="pages of the site")
+    parser.add_argument("--latency", type=float, default=0.005, help="seconds the server waits before answering")
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[8, 32], help="fetchers of each run")
+    parser.add_argument("--visited", choices=tuple(VISITED_STORES), default="set", help="store of visited URLs")
+    args = parser.parse_args()
+
+    with StubServer(SiteHandler, pages=args.pages, latency=args.latency) as server:
+        root, domain = f"http://127.0.0.1:{server.port}/", f"127.0.0.1:{server.port}"
+
+        print(f"{'fetchers':>8} {'pages':>7} {'seconds':>8} {'pages/s':>8}")
+        for concurrency in args.concurrency:
+            scanner = UrlScanner(concurrency=concurrency, limit_per_host=concurrency, visited=args.visited)
+            with scanner:
+                started = time.perf_counter()
+                pages = asyncio.run(scanner.crawl(root, domain, report=lambda links: None))
+                elapsed = time.perf_counter() - started
+
+            print(f"{concurrency:>8} {pages:>7} {elapsed:>8.1f} {pages / elapsed:>8.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,80 @@
+"""
+Cold start of module discovery, each run in a fresh interpreter.
+
+``cold`` discovers without a manifest, ``warm`` with the manifest of the
+previous run, and ``eager`` also imports every module like the menu did
+before discovery was lazy. Modules failing to import, e.g. for a missing
+optional dependency, are skipped. Memory is read with ``resource``, so the
+script runs on Unix only.
+
+    python -m benchmarks.startup --repeat 5
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+CHILD = """
+import json, resource, sys, time
+started = time.perf_counter()
+from utils.load_modules import ModuleLoadingError, collect_modules
+modules = collect_modules("./modules", manifest_path=sys.argv[1])
+if sys.argv[2] == "eager":
+    for descriptors in modules.values():
+        for descriptor in descriptors:
+            try:
+                descriptor.load()
+            except ModuleLoadingError:
+                pass
+print(json.dumps({
+    "seconds": time.perf_counter() - started,
+    "modules": len(sys.modules),
+    "rss": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+}))
+"""
+
+
+def measure(mode: str, manifest_path: str) -> dict[str, float]:
+    started = time.perf_counter()
+    output = subprocess.run(
+        [sys.executable, "-c", CHILD, manifest_path, mode],
+        cwd=ROOT,
+        capture_output=True,
+        text=True,
+        check=True
+    ).stdout
+    return {**json.loads(output.splitlines()[-1]), "process": time.perf_counter() - started}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--repeat", type=int, default=5, help="runs of each mode, the median is printed")
+    args = parser.parse_args()
+
+    print(f"{'mode':<6} {'discovery ms':>12} {'process ms':>11} {'modules':>8} {'RSS MiB':>8}")
+    with tempfile.TemporaryDirectory() as directory:
+        manifest_path = os.path.join(directory, "modules.json")
+        for mode in ("cold", "warm", "eager"):
+            runs = []
+            for _ in range(args.repeat):
+                if mode == "cold" and os.path.exists(manifest_path):
+                    os.remove(manifest_path)
+                runs.append(measure(mode, manifest_path))
+
+            median = {key: statistics.median(run[key] for run in runs) for key in runs[0]}
+            print(
+                f"{mode:<6} {median['seconds'] * 1000:>12.0f} {median['process'] * 1000:>11.0f}"
+                f" {median['modules']:>8.0f} {median['rss'] / 1024:>8.0f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
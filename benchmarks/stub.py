@@ -0,0 +1,103 @@
+from __future__ import annotations
+
+import multiprocessing
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any
+
+__all__ = [
+    "StubHandler",
+    "StubServer"
+]
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    """Keep-alive handler without request logging, counting the body bytes it sends."""
+
+    protocol_version = "HTTP/1.1"
+    # Small headers and bodies go out in separate writes, Nagle would hold them for the delayed ACK.
+    disable_nagle_algorithm = True
+
+    def log_message(self, format: str, *args: Any) -> None:
+        pass
+
+    def handle(self) -> None:
+        try:
+            super().handle()
+        except ConnectionError:
+            # The client closed the connection once it had enough bytes.
+            pass
+
+    def send_body(self, status: int, body: bytes, *, content_type: str = "text/html", head: bool = False) -> None:
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        if head:
+            return
+
+        try:
+            self.wfile.write(body)
+        except ConnectionError:
+            return
+        with self.server.sent.get_lock():
+            self.server.sent.value += len(body)
+
+
+def _serve(handler: type[StubHandler], connection: Any, sent: Any, attributes: dict[str, Any]) -> None:
+    server = ThreadingHTTPServer(("127.0.0.1", 0), handler)
+    server.daemon_threads = True
+    server.sent = sent
+    for name, value in attributes.items():
+        setattr(server, name, value)
+
+    connection.send(server.server_address[1])
+    server.serve_forever()
+
+
+class StubServer:
+    """
+    Local HTTP server answering with ``handler`` on a free loopback port.
+
+    The server runs in a child process, so it does not share the GIL with the
+    code under benchmark. Extra keyword arguments become attributes of the
+    server, read by the handler as ``self.server.<name>``.
+    """
+
+    def __init__(self, handler: type[StubHandler], **attributes: Any) -> None:
+        self.handler = handler
+        self.attributes = attributes
+        self.port = 0
+        self._sent = multiprocessing.Value("q", 0)
+        self._process: multiprocessing.Process | None = None
+
+    @property
+    def sent(self) -> int:
+        """Number of body bytes sent so far."""
+        return self._sent.value
+
+    def reset(self) -> None:
+        with self._sent.get_lock():
+            self._sent.value = 0
+
+    def start(self) -> None:
+        receiver, sender = multiprocessing.Pipe(duplex=False)
+        self._process = multiprocessing.Process(
+            target=_serve,
+            args=(self.handler, sender, self._sent, self.attributes),
+            daemon=True
+        )
+        self._process.start()
+        self.port = receiver.recv()
+
+    def stop(self) -> None:
+        if self._process is not None:
+            self._process.terminate()
+            self._process.join()
+            self._process = None
+
+    def __enter__(self) -> StubServer:
+        self.start()
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.stop()
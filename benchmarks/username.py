@@ -0,0 +1,77 @@
+"""
+Username sweep with and without probing, against a local stub server.
+
+Half of the status-only sites answer 404, every profile page is large and
+ranged requests are honoured, so the bytes sent show what probing saves.
+
+    python -m benchmarks.username --sites 400 --prefix-sites 100
+"""
+from __future__ import annotations
+
+import argparse
+import contextlib
+import io
+import time
+
+from benchmarks.stub import StubHandler, StubServer
+from modules.osint.username.tracker import UsernameLookup
+from utils.storage import configure_cache
+
+
+class ProfileHandler(StubHandler):
+    def answer(self, head: bool) -> None:
+        if self.path.startswith("/missing/"):
+            self.send_body(404, b"<html><body>Not found</body></html>", head=head)
+            return
+
+        body = self.server.page
+        if (ranged := self.headers.get("Range")) and not head:
+            start, end = ranged.removeprefix("bytes=").split("-")
+            self.send_body(206, body[int(start):int(end) + 1])
+            return
+        self.send_body(200, body, head=head)
+
+    def do_HEAD(self) -> None:
+        self.answer(head=True)
+
+    def do_GET(self) -> None:
+        self.answer(head=False)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sites", type=int, default=400, help="sites decided by the status code")
+    parser.add_argument("--prefix-sites", type=int, default=100, help="sites reading the first max_bytes")
+    parser.add_argument("--page-size", type=int, default=200_000, help="bytes of a profile page")
+    args = parser.parse_args()
+
+    # Every run must reach the server.
+    configure_cache(path=":memory:", refresh=True)
+    page = b"<html><head><title>alice</title></head><body>" + b"x" * args.page_size + b"</body></html>"
+
+    with StubServer(ProfileHandler, page=page) as server:
+        root = f"http://127.0.0.1:{server.port}"
+        sites = {
+            f"status{number}": {"url": f"{root}/{'missing' if number % 2 else 'user'}/{{user}}", "fetch_body": False}
+            for number in range(args.sites)
+        }
+        sites.update({
+            f"prefix{number}": {"url": f"{root}/user{number}/{{user}}", "max_bytes": 4096}
+            for number in range(args.prefix_sites)
+        })
+
+        print(f"{'engine':<8} {'mode':<6} {'found':>6} {'seconds':>8} {'KiB sent':>10}")
+        for engine in ("async", "threads"):
+            for probe in (False, True):
+                server.reset()
+                started = time.perf_counter()
+                with contextlib.redirect_stdout(io.StringIO()):
+                    found = UsernameLookup(engine=engine, probe=probe).sweep(sites, "alice")
+                elapsed = time.perf_counter() - started
+
+                mode = "probe" if probe else "full"
+                print(f"{engine:<8} {mode:<6} {len(found):>6} {elapsed:>8.2f} {server.sent // 1024:>10}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,27 +1,111 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+import argparse
+import json
+import os
+import sys
+from contextlib import nullcontext
+from dataclasses import fields
+from functools import lru_cache
+from typing import TYPE_CHECKING, Iterable, Iterator, TextIO
 
 from anytree import Node, RenderTree
 
-from utils import gradient_colorize, log_colorize, collect_modules
+from utils import ModuleLoadingError, gradient_colorize, log_colorize, collect_modules
 from utils.consts import BANNER
+from utils.storage import configure_cache
 
 if TYPE_CHECKING:
-    from utils.abc import BaseModule
+    from utils import ModuleDescriptor
+    from utils.abc import BaseModule, Result
 
 
-def main() -> None:
-    modules_dict = collect_modules("./modules")
+def read_targets(targets: Iterable[str], file_path: str | None) -> Iterator[str]:
+    """Yields targets given as arguments, then the lines of ``file_path``, ``-`` being the standard input."""
+    yield from targets
+    if file_path is None:
+        return
 
-    print(gradient_colorize(BANNER, start_color=0x5386E5, end_color=0xA1CAE3))
-    print(log_colorize("Starting utility", color=0x5386E5, prefix=">"))
+    with nullcontext(sys.stdin) if file_path == "-" else open(file_path, encoding="UTF-8") as file:
+        for line in file:
+            if line := line.strip():
+                yield line
+
+
+def write_results(results: Iterable[Result], output: TextIO, output_format: str) -> None:
+    """Writes results as they arrive, ``json`` waits for the last one to write a single array."""
+    if output_format == "json":
+        json.dump([result.to_dict() for result in results], output, ensure_ascii=False, indent=4, default=str)
+        output.write("\n")
+        return
+
+    for result in results:
+        if output_format == "jsonl":
+            output.write(json.dumps(result.to_dict(), ensure_ascii=False, default=str) + "\n")
+        else:
+            found = {True: "found", False: "not found", None: "unknown"}[result.found]
+            details = result.error or json.dumps(result.data, ensure_ascii=False, default=str)
+            target = result.target if result.subject in (None, result.target) else f"{result.subject} > {result.target}"
+            output.write(f"{target}\t{result.source or '-'}\t{found}\t{details}\n")
+        output.flush()
+
+
+def common_arguments() -> argparse.ArgumentParser:
+    """Parent parser of the options accepted both before and after the command."""
+    parser = argparse.ArgumentParser(add_help=False)
+    parser.add_argument("--refresh", action="store_true", help="ignore cached results and query every site again")
+    return parser
+
+
+def run_command(descriptor: ModuleDescriptor, arguments: list[str], prog: str) -> int:
+    """Runs a module without prompts, with its targets and options taken from ``arguments``."""
+    parser = argparse.ArgumentParser(
+        prog=f"{prog} {descriptor.command}",
+        description=f"Run the {descriptor.name} module",
+        parents=[common_arguments()]
+    )
+    parser.add_argument("targets", nargs="*", help="targets of the module")
+    parser.add_argument("--file", "-f", help="read one target per line from a file, - for the standard input")
+    parser.add_argument("--format", choices=("jsonl", "json", "text"), default="jsonl", help="output format")
+    parser.add_argument("--output", "-o", help="write results to a file instead of the standard output")
+
+    module = descriptor.load()
+    if module.Params is None:
+        parser.error(f"module {descriptor.command} cannot run non-interactively")
+
+    module.add_arguments(parser)
+    args = parser.parse_args(arguments)
+    if not args.targets and args.file is None:
+        parser.error("no targets, pass them as arguments or with --file")
+    if args.refresh:
+        configure_cache(refresh=True)
 
+    values = {
+        field.name: tuple(value) if isinstance(value, list) else value
+        for field in fields(module.Params)
+        if (value := getattr(args, field.name, None)) is not None
+    }
+    values["targets"] = read_targets(args.targets, args.file)
+    params = module.Params(**values)
+
+    with (
+        nullcontext(sys.stdout) if args.output is None else open(args.output, encoding="UTF-8", mode="w") as output,
+        module
+    ):
+        write_results(module.execute(params), output, args.format)
+    return 0
+
+
+@lru_cache(maxsize=1)
+def render_menu(
+        modules: tuple[tuple[str, tuple[ModuleDescriptor, ...]], ...]
+) -> tuple[str, dict[int, ModuleDescriptor]]:
+    """Returns the colored module tree and the modules by number, rendered again only when modules change."""
     modules_node = Node("modules")
 
     module_number = 1
-    module_mapping: dict[int, BaseModule] = {}
-    for module_name, module_list in modules_dict.items():
+    module_mapping: dict[int, ModuleDescriptor] = {}
+    for module_name, module_list in modules:
         parent_node = Node(f"{module_name}", parent=modules_node)
         for module in module_list:
             module_with_number = f"{module.name} (#{module_number})"
@@ -29,26 +113,71 @@ def main() -> None:
             module_mapping[module_number] = module
             module_number += 1
 
-    tree = ""
-    for pre, fill, node in RenderTree(modules_node):
-        tree += f">          {pre}{node.name}\n"
+    tree = "\n".join(f">          {pre}{node.name}" for pre, fill, node in RenderTree(modules_node))
+    return gradient_colorize(tree, start_color=0x5386E5, end_color=0xA1CAE3), module_mapping
 
-    print(gradient_colorize(tree[:len(tree) - 1], start_color=0x5386E5, end_color=0xA1CAE3))
+
+def main() -> None:
+    modules_dict = collect_modules("./modules")
+    menu, module_mapping = render_menu(tuple(
+        (module_name, tuple(module_list)) for module_name, module_list in modules_dict.items()
+    ))
+
+    print(gradient_colorize(BANNER, start_color=0x5386E5, end_color=0xA1CAE3))
+    print(log_colorize("Starting utility", color=0x5386E5, prefix=">"))
+    print(menu)
 
     try:
         print(log_colorize("Choose a module", color=0x5386E5, prefix="<"), end="")
         selected_number = int(input())
         if selected_number in module_mapping:
-            with module_mapping[selected_number] as module:
+            with module_mapping[selected_number].load() as module:
                 module: BaseModule
                 module.run()
         else:
             print("Invalid module number.")
     except ValueError:
         print("Please enter a valid number.")
+    except ModuleLoadingError as e:
+        print(log_colorize(str(e), color=0x9487F4, prefix="@"))
 
 
 if __name__ == '__main__':
+    commands = {
+        descriptor.command: descriptor
+        for module_list in collect_modules("./modules").values()
+        for descriptor in module_list
+    }
+
+    parser = argparse.ArgumentParser(
+        description="Neptune OSINT utility, interactive unless a command is given",
+        epilog=f"commands: {', '.join(sorted(commands))}, see COMMAND --help for their options",
+        parents=[common_arguments()]
+    )
+    parser.add_argument("command", nargs="?", help="module to run without prompts")
+    parser.add_argument("arguments", nargs=argparse.REMAINDER, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    configure_cache(refresh=args.refresh)
+
+    if args.command is not None:
+        if args.command not in commands:
+            parser.error(f"unknown command {args.command!r}, expected one of {', '.join(sorted(commands))}")
+        try:
+            sys.exit(run_command(commands[args.command], args.arguments, parser.prog))
+        except ModuleLoadingError as e:
+            print(log_colorize(str(e), color=0x9487F4, prefix="@"), file=sys.stderr)
+            sys.exit(1)
+        except BrokenPipeError:
+            # The reader, e.g. head, exited, silence the flush of the standard output at shutdown.
+            os.dup2(os.open(os.devnull, os.O_WRONLY), sys.stdout.fileno())
+            sys.exit(1)
+        except (OSError, ValueError) as e:
+            print(log_colorize(f"Error : {type(e).__name__} - {e}", color=0x9487F4, prefix="@"), file=sys.stderr)
+            sys.exit(1)
+        except KeyboardInterrupt:
+            sys.exit(130)
+
     while True:
         main()
 
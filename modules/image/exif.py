@@ -1,13 +1,34 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
 from json import loads, JSONDecodeError
 from os.path import isfile
+from typing import TYPE_CHECKING, Iterable, Iterator
+
 from pyexiv2 import Image
 
 from utils import log_colorize, colorize
-from utils.abc import BaseModule
+from utils.abc import BaseModule, Result
 from utils.consts.banners import EXIF_BANNER
 
+if TYPE_CHECKING:
+    from argparse import ArgumentParser
+
 
 class Exif(BaseModule, name='exif'):
+    @dataclass(frozen=True, slots=True)
+    class Params:
+        """
+        Parameters
+        ----------
+            targets : Iterable[str]
+                Image paths.
+
+            clear : bool
+                Clear the EXIF of the images instead of reading it.
+        """
+        targets: Iterable[str]
+        clear: bool = False
 
     @staticmethod
     def __print_formatted_exif(exif: dict) -> None:
@@ -37,6 +58,29 @@ class Exif(BaseModule, name='exif'):
 
         self.__print_formatted_exif(exif=data)
 
+    @classmethod
+    def add_arguments(cls, parser: ArgumentParser) -> None:
+        parser.add_argument("--clear", action="store_true", help="clear the EXIF instead of reading it")
+
+    def execute(self, params: Params) -> Iterator[Result]:
+        for target in params.targets:
+            if not (img_path := target.strip()):
+                continue
+            if not isfile(img_path):
+                yield Result(module=self.command, target=img_path, error="File not found")
+                continue
+
+            try:
+                with Image(img_path) as img:
+                    if params.clear:
+                        img.clear_exif()
+                        yield Result(module=self.command, target=img_path, found=True, data={"cleared": True})
+                    else:
+                        data: dict = img.read_exif()
+                        yield Result(module=self.command, target=img_path, found=bool(data), data=data)
+            except (OSError, RuntimeError) as e:
+                yield Result(module=self.command, target=img_path, error=f"Error : {type(e).__name__} - {e}")
+
     def run(self) -> None:
         self.print_banner(EXIF_BANNER)
         print(log_colorize("Input image path: ", color=0x5386E5, prefix="<"), end="")
@@ -1,27 +1,186 @@
+import json
+import os
+from argparse import ArgumentParser
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, as_completed, wait
+from dataclasses import dataclass
+from typing import Final, Iterable, Iterator
+
 from whois import whois
 
-from utils import log_colorize, gradient_colorize
-from utils.abc import BaseModule
+from utils import colorize, log_colorize
+from utils.abc import BaseModule, Result
 from utils.consts import SCAN_BANNER
+from utils.net import KeyedThrottle
+from utils.storage import get_cache
+
+CACHE_MODULE: Final[str] = "whois"
+CACHE_TTL: Final[float] = 7 * 24 * 60 * 60
 
 
 class Whois(BaseModule, name="whois"):
+    @dataclass(frozen=True, slots=True)
+    class Params:
+        """
+        Parameters
+        ----------
+            targets : Iterable[str]
+                Domains to look up, consumed lazily.
+
+            workers : int
+                Number of lookups running at the same time.
+
+            delay : float
+                Minimum number of seconds between two queries to the same registry.
+        """
+        targets: Iterable[str]
+        workers: int = 8
+        delay: float = 1.0
 
     @staticmethod
     def ask_domain() -> str:
         print(log_colorize("Input network url", color=0x5386E5, prefix="<"), end="")
         return input()
 
+    @staticmethod
+    def registry_of(domain: str) -> str:
+        """Key of the registry answering for the domain, WHOIS servers are assigned per TLD."""
+        return domain.rsplit(".", 1)[-1]
+
     @classmethod
-    def run(cls) -> None:
-        cls.print_banner(SCAN_BANNER)
+    def lookup(cls, domain: str, throttle: KeyedThrottle | None = None) -> dict:
+        """
+        Returns the parsed WHOIS record of a domain as a JSON-ready dict.
+
+        Records are cached on disk for a week, failed lookups are not cached.
+        """
+        domain = domain.strip().lower()
+        registry = cls.registry_of(domain)
+        cache = get_cache()
+
+        if (record := cache.get(CACHE_MODULE, registry, domain)) is not None:
+            return {"domain": domain, "record": record, "error": None}
+
+        try:
+            if throttle is not None:
+                throttle.wait(registry)
+            record = json.loads(json.dumps(dict(whois(domain)), default=str))
+        except Exception as e:
+            return {"domain": domain, "record": None, "error": f"{type(e).__name__}: {e}"}
+
+        cache.set(CACHE_MODULE, registry, domain, record, ttl=CACHE_TTL)
+        return {"domain": domain, "record": record, "error": None}
+
+    @classmethod
+    def lookup_many(cls, domains: Iterable[str], *, workers: int = 8, delay: float = 1.0) -> Iterator[dict]:
+        """
+        Looks up many domains on a bounded worker pool and yields records as they complete.
+
+        Parameters
+        ----------
+            domains : Iterable[str]
+                Domains to look up, consumed lazily, blank entries are skipped.
+
+            workers : int
+                Number of lookups running at the same time.
+
+            delay : float
+                Minimum number of seconds between two queries to the same registry.
+        """
+        throttle = KeyedThrottle(delay=delay)
+
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            pending = set()
+            for domain in domains:
+                if not domain.strip():
+                    continue
+
+                pending.add(executor.submit(cls.lookup, domain, throttle))
+                if len(pending) >= workers * 2:
+                    done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        yield future.result()
+
+            for future in as_completed(pending):
+                yield future.result()
+
+    @classmethod
+    def add_arguments(cls, parser: ArgumentParser) -> None:
+        parser.add_argument("--workers", type=int, default=8, help="lookups running at the same time")
+        parser.add_argument("--delay", type=float, default=1.0, help="seconds between queries to one registry")
+
+    def to_result(self, record: dict) -> Result:
+        return Result(
+            module=self.command,
+            target=record["domain"],
+            source=self.registry_of(record["domain"]),
+            found=None if record["error"] else bool(record["record"].get("domain_name")),
+            data=record["record"] or {},
+            error=record["error"]
+        )
+
+    def execute(self, params: Params) -> Iterator[Result]:
+        for record in self.lookup_many(params.targets, workers=params.workers, delay=params.delay):
+            yield self.to_result(record)
+
+    @classmethod
+    def run_single(cls) -> None:
         domain = cls.ask_domain()
 
         print(log_colorize(f"Scanning website {domain}...", color=0x5386E5, prefix=">"))
 
-        for key, value in whois(domain).items():
+        result = cls.lookup(domain)
+        if result["error"]:
+            return print(log_colorize(f"Error : {result['error']}", color=0x9487F4, prefix="@"))
+
+        for key, value in result["record"].items():
             print(f"{log_colorize(key.capitalize() + ":", color=0x5386E5, prefix="+")} {value}")
 
+    @classmethod
+    def run_batch(cls) -> None:
+        print(log_colorize("Input domains file path", color=0x5386E5, prefix="<"), end="")
+        domains_path = input().strip()
+
+        if not os.path.isfile(domains_path):
+            return print(log_colorize("File not found", color=0x9487F4, prefix=">"))
+
+        print(log_colorize("Input output .jsonl file path", color=0x5386E5, prefix="<"), end="")
+        output_path = input().strip() or "whois.jsonl"
+
+        found = failed = 0
+        with (
+            open(domains_path, encoding="UTF-8") as domains,
+            open(output_path, encoding="UTF-8", mode="a") as output
+        ):
+            for result in cls.lookup_many(domains):
+                output.write(json.dumps(result) + "\n")
+                output.flush()
+
+                if result["error"]:
+                    failed += 1
+                    print(log_colorize(f"{result['domain']} : {result['error']}", color=0x9487F4, prefix="@"))
+                else:
+                    found += 1
+                    print(log_colorize(result["domain"], color=0x6BFF73, prefix="+"))
+
+        print(log_colorize(f"Records written: {found}, failed: {failed}", color=0x5386E5, prefix=">"))
+
+    @classmethod
+    def run(cls) -> None:
+        cls.print_banner(SCAN_BANNER)
+
+        print(colorize("\n>          Single domain (#1)", color=0x5386E5))
+        print(colorize(">          Domains file (#2)\n", color=0x5386E5))
+        print(log_colorize("Choice", color=0x5386E5, prefix="<"), end="")
+        choice = input().strip()
+
+        match choice:
+            case "1":
+                cls.run_single()
+            case "2":
+                cls.run_batch()
+            case _:
+                print(log_colorize("Invalid choice", color=0x9487F4, prefix=">"))
+
 
 def load() -> BaseModule:
     return Whois()
@@ -1,14 +1,28 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Iterable, Iterator
+
 import requests
 
 from utils import log_colorize
-from utils.abc import BaseModule
+from utils.abc import BaseModule, Result
 from utils.consts import SQL_BANNER
 
 
 class SqlMap(BaseModule, name="sql-map"):
+    @dataclass(frozen=True, slots=True)
+    class Params:
+        """
+        Parameters
+        ----------
+            targets : Iterable[str]
+                URLs the provocations are appended to, ``https://`` is assumed without a scheme.
+        """
+        targets: Iterable[str]
 
-    @staticmethod
-    def execute_sql_queries(url: str) -> None:
+    def scan(self, url: str) -> Iterator[Result]:
+        """Yields a result per detected vulnerability, a negative one if none is, or the error that stopped the scan."""
         sql_indicators = [
             "SQL syntax", "SQL error", "MySQL", "mysql", "MySQLYou",
             "Unclosed quotation mark", "SQLSTATE", "syntax error", "ORA-",
@@ -40,23 +54,52 @@ class SqlMap(BaseModule, name="sql-map"):
                     for sql_indicator in sql_indicators:
                         if sql_indicator in response.text:
                             found += 1
-                            print(log_colorize(
-                                f"Sql Map vulnerability has been detected.\n "
-                                f"> Error: {sql_indicator}\n"
-                                f"> Provocation: {sql_provocation}",
-                                color=0x6BFF73,
-                                prefix=">"
-                            ))
+                            yield Result(
+                                module=self.command,
+                                target=url,
+                                source=sql_provocation,
+                                found=True,
+                                data={"indicator": sql_indicator}
+                            )
                             break
 
                 else:
-                    print(log_colorize(f"Error : {response.status_code} - {response.reason} - {response.text}", color=0x9487F4, prefix="@"))
+                    yield Result(
+                        module=self.command,
+                        target=url,
+                        source=sql_provocation,
+                        data={"status_code": response.status_code},
+                        error=f"Error : {response.status_code} - {response.reason} - {response.text}"
+                    )
         except Exception as e:
-            print(log_colorize(f"Error : {type(e).__name__} - {e}", color=0x9487F4, prefix="@"))
+            yield Result(module=self.command, target=url, error=f"Error : {type(e).__name__} - {e}")
         else:
             if not found:
+                yield Result(module=self.command, target=url, found=False)
+
+    def execute_sql_queries(self, url: str) -> None:
+        for result in self.scan(url):
+            if result.error is not None:
+                print(log_colorize(result.error, color=0x9487F4, prefix="@"))
+            elif result.found:
+                print(log_colorize(
+                    f"Sql Map vulnerability has been detected.\n "
+                    f"> Error: {result.data['indicator']}\n"
+                    f"> Provocation: {result.source}",
+                    color=0x6BFF73,
+                    prefix=">"
+                ))
+            else:
                 print(log_colorize("No vulnerability detected", color=0x5386E5, prefix=">"))
 
+    def execute(self, params: Params) -> Iterator[Result]:
+        for target in params.targets:
+            if not (url := target.strip()):
+                continue
+            if not url.startswith(("https://", "http://")):  # noqa
+                url = "https://" + url
+            yield from self.scan(url)
+
     def run(self) -> None:
         self.print_banner(SQL_BANNER)
         print(log_colorize("Input website url", color=0x5386E5, prefix="<"), end="")
@@ -1,78 +1,379 @@
+from __future__ import annotations
+
+import asyncio
 import re
-from urllib.parse import urljoin
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, AsyncIterator, Callable, Final, Iterable, Iterator, Literal
+from urllib.parse import urlsplit
+
 import requests
-from bs4 import BeautifulSoup
 
 from utils import log_colorize, colorize
-from utils.abc import BaseModule
+from utils.abc import BaseModule, Result, iterate_emitted, iterate_emitted_async, resource
 from utils.consts import SCAN_BANNER
+from utils.net import HostThrottle, TimeoutSession, create_session
+from utils.parsing import LinkExtractor, canonicalize_url, host_in_scope
+from utils.storage import VISITED_STORES, CrawlState, VisitedStore, create_visited_store
+
+if TYPE_CHECKING:
+    from argparse import ArgumentParser
+
+    from aiohttp import ClientSession
+
+CHUNK_SIZE: Final[int] = 64 * 1024
+PAGE_EXTENSION_PATTERN: Final[re.Pattern] = re.compile(r'\.(html|xhtml|php|js|css)$')
+ANY_EXTENSION_PATTERN: Final[re.Pattern] = re.compile(r'\.\w+$')
 
 
 class UrlScanner(BaseModule, name="url-scanner"):
-    def __init__(self) -> None:
-        self.all_links: set[str] = set()
+    @dataclass(frozen=True, slots=True)
+    class Params:
+        """
+        Parameters
+        ----------
+            targets : Iterable[str]
+                Website URLs, ``https://`` is assumed without a scheme.
+
+            crawl : bool
+                Crawl the whole website instead of the given page only.
+
+            resume : bool
+                Resume an interrupted crawl of the same website.
+
+            max_depth : int | None
+                Pages deeper than this are not expanded.
+
+            max_pages : int | None
+                Maximum number of fetched pages per website.
+
+            visited : str | None
+                Kind of visited store, see ``create_visited_store``, the one of the scanner if not set.
+        """
+        targets: Iterable[str]
+        crawl: bool = False
+        resume: bool = False
+        max_depth: int | None = None
+        max_pages: int | None = None
+        visited: str | None = None
+
+    def __init__(
+            self,
+            *,
+            concurrency: int = 16,
+            limit_per_host: int = 8,
+            timeout: float = 10,
+            delay: float = 0.0,
+            max_depth: int | None = None,
+            max_pages: int | None = None,
+            max_page_bytes: int | None = None,
+            visited: Literal["set", "fingerprint", "bloom", "disk"] = "set",
+            visited_options: dict[str, Any] | None = None
+    ) -> None:
+        self.visited = visited
+        self.visited_options = visited_options or {}
+        self.concurrency = concurrency
+        self.limit_per_host = limit_per_host
+        self.timeout = timeout
+        self.delay = delay
+        self.max_depth = max_depth
+        self.max_pages = max_pages
+        self.max_page_bytes = max_page_bytes
+
+    @resource
+    def all_links(self) -> VisitedStore:
+        return create_visited_store(self.visited, **self.visited_options)
+
+    @all_links.closer
+    def all_links(self, store: VisitedStore) -> None:
+        store.close()
 
     @staticmethod
-    def is_valid_extension(url: str) -> bool:
-        return re.search(r'\.(html|xhtml|php|js|css)$', url) or not re.search(r'\.\w+$', url)
+    def is_valid_extension(path: str) -> bool:
+        return bool(PAGE_EXTENSION_PATTERN.search(path)) or not ANY_EXTENSION_PATTERN.search(path)
+
+    def extract_links(self, raw_links: Iterable[str], base_url: str, domain: str) -> list[str]:
+        """
+        Returns canonical links of the domain that were not seen before and marks them as seen.
 
-    def extract_links(self, tag, attribute: str, base_url: str, domain: str) -> list[str]:
+        ``base_url`` should be the final URL of the response, relative links are
+        resolved against it before their trailing slash is dropped.
+        """
         links = []
-        attr_value = tag.get(attribute)
-        if attr_value:
-            full_url = urljoin(base_url, attr_value)
-            if full_url not in self.all_links and domain in full_url and self.is_valid_extension(full_url):
+        for raw_link in raw_links:
+            parts = canonicalize_url(raw_link, base_url)
+            if parts is None or not host_in_scope(parts.hostname, domain):
+                continue
+
+            full_url = parts.geturl()
+            if self.is_valid_extension(parts.path) and self.all_links.add(full_url):
                 links.append(full_url)
-                self.all_links.add(full_url)
         return links
 
-    def find_secret_urls(self, website_url: str, domain: str) -> None:
-        try:
-            response = requests.get(website_url)
-            if response.status_code != 200:
-                return
+    @staticmethod
+    def report(links: list[str]) -> None:
+        for link in links:
+            print(f"{log_colorize('URL :', color=0x5386E5, prefix='+')} {link}")
 
-            soup = BeautifulSoup(response.content, 'html.parser')
-            temp_links = []
+    @staticmethod
+    def report_error(url: str, error: str) -> None:
+        print(log_colorize(error, color=0x9487F4, prefix="@"))
 
-            # Collect links from common attributes
-            for tag in soup.find_all(['a', 'link', 'script', 'img', 'iframe', 'button', 'form']):
-                for attr in ['href', 'src', 'action']:
-                    temp_links.extend(self.extract_links(tag, attr, website_url, domain))
+    def scan_page(self, website_url: str, domain: str, report: Callable[[list[str]], None]) -> None:
+        with TimeoutSession(self.timeout) as session, session.get(website_url, stream=True) as response:
+            if response.status_code != 200:
+                return
 
-            # Collect inline JavaScript links
-            for script in soup.find_all('script'):
-                if script.string:
-                    urls_in_script = re.findall(r'(https?://\S+)', script.string)
-                    for url in urls_in_script:
-                        if url not in self.all_links and domain in url and self.is_valid_extension(url):
-                            temp_links.append(url)
-                            self.all_links.add(url)
+            extractor = LinkExtractor(response.encoding)
+            received = 0
+            for chunk in response.iter_content(CHUNK_SIZE):
+                report(self.extract_links(extractor.feed(chunk), response.url, domain))
+                received += len(chunk)
+                if self.max_page_bytes is not None and received >= self.max_page_bytes:
+                    break
 
-            for link in temp_links:
-                print(f"{log_colorize('URL :', color=0x5386E5, prefix='+')} {link}")
+            report(self.extract_links(extractor.close(), response.url, domain))
 
+    def find_secret_urls(self, website_url: str, domain: str) -> None:
+        try:
+            self.scan_page(website_url, domain, self.report)
         except requests.RequestException as e:
             print(log_colorize(f"RequestError : {e}", color=0x9487F4, prefix="@"))
 
-    def find_all_secret_urls(self, website_url: str, domain: str) -> None:
-        self.find_secret_urls(website_url, domain)
-        visited_links = set()
+    async def iter_page_links(
+            self,
+            session: ClientSession,
+            throttle: HostThrottle,
+            url: str,
+            domain: str
+    ) -> AsyncIterator[list[str]]:
+        """Streams the page and yields the new links of every parsed chunk."""
+        async with throttle.slot(urlsplit(url).netloc):
+            async with session.get(url) as response:
+                if response.status != 200:
+                    return
+
+                base_url = str(response.url)
+                extractor = LinkExtractor(response.charset)
+                received = 0
+                async for chunk in response.content.iter_chunked(CHUNK_SIZE):
+                    yield self.extract_links(extractor.feed(chunk), base_url, domain)
+
+                    received += len(chunk)
+                    if self.max_page_bytes is not None and received >= self.max_page_bytes:
+                        response.close()
+                        break
+
+                yield self.extract_links(extractor.close(), base_url, domain)
+
+    async def crawl(
+            self,
+            website_url: str,
+            domain: str,
+            state: CrawlState | None = None,
+            *,
+            report: Callable[[list[str]], None] | None = None,
+            report_error: Callable[[str, str], None] | None = None
+    ) -> int:
+        """
+        Crawls the website breadth-first with a pool of concurrent fetchers.
+
+        Every link is queued once, the first time it is discovered. Pages deeper
+        than ``max_depth`` are not expanded and no more than ``max_pages`` pages
+        are fetched. With a state holding unprocessed links, the crawl resumes
+        from them instead of the root.
 
-        while True:
-            new_links = [link for link in self.all_links if link not in visited_links]
-            if not new_links:
-                break
+        Parameters
+        ----------
+            website_url : str
+                Root page of the crawl.
 
-            for link in new_links:
+            domain : str
+                Only links to the domain and its subdomains are followed.
+
+            state : CrawlState | None
+                Started state recording the frontier and visited links.
+
+            report : Callable[[list[str]], None] | None
+                Receives new links as they are found, printed by default.
+
+            report_error : Callable[[str, str], None] | None
+                Receives the URL and error of failed pages, printed by default.
+
+        Returns
+        -------
+            int
+                Number of requested pages.
+        """
+        import aiohttp
+
+        report = report or self.report
+        report_error = report_error or self.report_error
+        frontier: asyncio.Queue[tuple[str, int]] = asyncio.Queue()
+        throttle = HostThrottle(concurrency=self.limit_per_host, delay=self.delay)
+        fetched = 0
+
+        pending = state.pending() if state is not None else []
+        if pending:
+            for url in state.seen():
+                self.all_links.add(url)
+            for url, depth in pending:
+                frontier.put_nowait((url, depth))
+            scheduled = state.scheduled()
+        else:
+            if (root := canonicalize_url(website_url)) is not None:
+                website_url = root.geturl()
+            self.all_links.add(website_url)
+            frontier.put_nowait((website_url, 0))
+            scheduled = 1
+            if state is not None:
+                state.discovered(website_url, 0)
+
+        async def worker() -> None:
+            nonlocal scheduled, fetched
+            while True:
+                url, depth = await frontier.get()
                 try:
-                    self.find_secret_urls(link, domain)
-                    visited_links.add(link)
+                    expand = self.max_depth is None or depth < self.max_depth
+                    async for links in self.iter_page_links(session, throttle, url, domain):
+                        report(links)
+
+                        for link in links:
+                            queued = expand and (self.max_pages is None or scheduled < self.max_pages)
+                            if queued:
+                                frontier.put_nowait((link, depth + 1))
+                                scheduled += 1
+                            if state is not None:
+                                state.discovered(link, depth + 1 if queued else None)
+
+                except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                    report_error(url, f"RequestError : {url} - {e}")
                 except Exception as e:
-                    print(log_colorize(f"Error : {type(e).__name__} - {e}", color=0x9487F4, prefix="@"))
+                    report_error(url, f"Error : {type(e).__name__} - {e}")
+
+                # Cancelled pages are left unprocessed in the state and fetched again on resume.
+                fetched += 1
+                frontier.task_done()
+                if state is not None:
+                    state.visited(url)
+
+        async with create_session(
+                limit=self.concurrency,
+                limit_per_host=self.limit_per_host,
+                timeout=self.timeout
+        ) as session:
+            workers = [asyncio.create_task(worker()) for _ in range(self.concurrency)]
+            joined = asyncio.create_task(frontier.join())
+            try:
+                # Workers only return by raising, e.g. when a report callback stops the crawl.
+                done, _ = await asyncio.wait([joined, *workers], return_when=asyncio.FIRST_COMPLETED)
+            finally:
+                for task in (joined, *workers):
+                    task.cancel()
+                await asyncio.gather(joined, *workers, return_exceptions=True)
+
+            for task in done:
+                if task is not joined:
+                    task.result()
+
+        return fetched
+
+    async def crawl_website(
+            self,
+            website_url: str,
+            domain: str,
+            *,
+            resume: bool = False,
+            report: Callable[[list[str]], None] | None = None,
+            report_error: Callable[[str, str], None] | None = None
+    ) -> None:
+        """
+        Crawls the whole website, recording its state on disk until the crawl completes.
+
+        With ``resume``, an interrupted crawl of the same root and domain goes on
+        from its saved frontier, otherwise any saved state is discarded.
+        """
+        state = CrawlState.for_crawl(website_url, domain)
+        if not resume:
+            state.clear()
+
+        with state:
+            await self.crawl(website_url, domain, state, report=report, report_error=report_error)
+        state.clear()
+
+    def find_all_secret_urls(
+            self,
+            website_url: str,
+            domain: str,
+            *,
+            resume: bool = False,
+            report: Callable[[list[str]], None] | None = None,
+            report_error: Callable[[str, str], None] | None = None
+    ) -> None:
+        asyncio.run(self.crawl_website(
+            website_url, domain, resume=resume, report=report, report_error=report_error
+        ))
+
+    @classmethod
+    def add_arguments(cls, parser: ArgumentParser) -> None:
+        parser.add_argument("--crawl", action="store_true", help="crawl the whole website")
+        parser.add_argument("--resume", action="store_true", help="resume an interrupted crawl")
+        parser.add_argument("--max-depth", type=int, help="do not expand pages deeper than this")
+        parser.add_argument("--max-pages", type=int, help="fetch at most this many pages per website")
+        parser.add_argument("--visited", choices=tuple(VISITED_STORES), help="store of visited URLs")
+
+    def execute(self, params: Params) -> Iterator[Result]:
+        self.max_depth = params.max_depth
+        self.max_pages = params.max_pages
+        if params.visited is not None:
+            self.visited = params.visited
+
+        for target in params.targets:
+            if not (website_url := target.strip()):
+                continue
+            if not website_url.startswith(("https://", "http://")):  # noqa
+                website_url = "https://" + website_url
+            domain = urlsplit(website_url).netloc
+
+            def reporters(
+                    emit: Callable[[Result], None]
+            ) -> tuple[Callable[[list[str]], None], Callable[[str, str], None]]:
+                def report(links: list[str]) -> None:
+                    for link in links:
+                        emit(Result(module=self.command, target=website_url, found=True, data={"url": link}))
+
+                def report_error(url: str, error: str) -> None:
+                    emit(Result(module=self.command, target=website_url, data={"url": url}, error=error))
+
+                return report, report_error
+
+            # The visited store is built, used and closed on the producer thread.
+            async def produce_crawl(emit: Callable[[Result], None]) -> None:
+                report, report_error = reporters(emit)
+                UrlScanner.all_links.release(self)
+                try:
+                    await self.crawl_website(
+                        website_url, domain, resume=params.resume, report=report, report_error=report_error
+                    )
+                finally:
+                    UrlScanner.all_links.release(self)
+
+            def produce_page(emit: Callable[[Result], None]) -> None:
+                report, report_error = reporters(emit)
+                UrlScanner.all_links.release(self)
+                try:
+                    self.scan_page(website_url, domain, report)
+                except requests.RequestException as e:
+                    report_error(website_url, f"RequestError : {e}")
+                finally:
+                    UrlScanner.all_links.release(self)
+
+            if params.crawl:
+                yield from iterate_emitted_async(produce_crawl)
+            else:
+                yield from iterate_emitted(produce_page)
 
     def run(self) -> None:
-        self.all_links.clear()
+        UrlScanner.all_links.release(self)
 
         self.print_banner(SCAN_BANNER)
         print(log_colorize("Input network URL", color=0x5386E5, prefix="<"), end="")
@@ -80,7 +381,7 @@ class UrlScanner(BaseModule, name="url-scanner"):
 
         if not website_url.startswith(("https://", "http://")):  # noqa
             website_url = "https://" + website_url
-        domain = re.sub(r'^https?://', '', website_url).split('/')[0]
+        domain = urlsplit(website_url).netloc
 
         print(colorize("\n>          Only Url (#1)", color=0x5386E5))
         print(colorize(">          All Website (#2)\n", color=0x5386E5))
@@ -91,7 +392,13 @@ class UrlScanner(BaseModule, name="url-scanner"):
             case "1":
                 self.find_secret_urls(website_url, domain)
             case "2":
-                self.find_all_secret_urls(website_url, domain)
+                resume = False
+                if CrawlState.for_crawl(website_url, domain).exists():
+                    print(log_colorize("Resume previous crawl? (y/n)", color=0x5386E5, prefix="<"), end="")
+                    resume = input().strip().lower() in ["yes", "y"]
+
+                self.find_all_secret_urls(website_url, domain, resume=resume)
+                print(log_colorize(self.all_links.summary(), color=0x5386E5, prefix=">"))
 
 
 def load() -> BaseModule:
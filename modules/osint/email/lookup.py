@@ -1,52 +1,55 @@
-import re
+import asyncio
+import json
+import os
+from argparse import ArgumentParser
+from dataclasses import dataclass
+from typing import AsyncIterator, Callable, Iterable, Iterator, TextIO
 
-import dns.resolver
-
-from utils import log_colorize
-from utils.abc import BaseModule
+from utils import colorize, log_colorize
+from utils.abc import BaseModule, Result, iterate_emitted_async
 from utils.consts import SCAN_BANNER
+from utils.net import CachedResolver, get_resolver
+from utils.parsing import parse_email_address
 
 
-class EmailLookup(BaseModule, name="lookup"):
-
-    @staticmethod
-    def get_email_info(email: str) -> dict:
-        info = {}
-        email_parts = email.split('@')
-        try:
-            info["name"] = email_parts[0]
-        except IndexError:
-            pass
-
-        domain_mather = re.search(r"@([^@.]+)\.", email)
-        if domain_mather:
-            info["domain"] = domain_mather.group(1)
+class EmailLookup(BaseModule, name="lookup", command="email"):
+    @dataclass(frozen=True, slots=True)
+    class Params:
+        """
+        Parameters
+        ----------
+            targets : Iterable[str]
+                Email addresses to look up.
 
-        try:
-            info["tld"] = f".{email.split('.')[-1]}"
-        except IndexError:
-            pass
+            concurrency : int
+                Number of domains resolved at the same time.
+        """
+        targets: Iterable[str]
+        concurrency: int = 32
 
-        info["domain_all"] = f"{info.get('domain')}{info.get('tld')}"
-
-        try:
-            mx_records = dns.resolver.resolve(info.get("domain_all"), 'MX')
-            mx_servers = [str(record.exchange) for record in mx_records]  # noqa
-            info["mx_servers"] = mx_servers
-        except (dns.resolver.NoAnswer, dns.resolver.NXDOMAIN):
-            pass
+    @staticmethod
+    async def get_domain_info(domain: str, resolver: CachedResolver | None = None) -> dict:
+        """Resolves the MX, SPF and DMARC records of a mail domain concurrently."""
+        resolver = resolver or get_resolver()
+        # Wait for every query, so a failed one does not leave the others unretrieved.
+        answers = await asyncio.gather(
+            resolver.resolve(domain, 'MX'),
+            resolver.resolve(domain, 'SPF'),
+            resolver.resolve(f'_dmarc.{domain}', 'TXT'),
+            return_exceptions=True
+        )
+        for answer in answers:
+            if isinstance(answer, BaseException):
+                raise answer
+        mx_records, spf_records, dmarc_records = answers
 
-        try:
-            spf_records = dns.resolver.resolve(info.get("domain_all"), 'SPF')
+        info = {}
+        if mx_records:
+            info["mx_servers"] = [str(record.exchange) for record in mx_records]  # noqa
+        if spf_records:
             info["spf_records"] = [str(record) for record in spf_records]
-        except (dns.resolver.NoAnswer, dns.resolver.NXDOMAIN):
-            pass
-
-        try:
-            dmarc_records = dns.resolver.resolve(f'_dmarc.{info.get("domain_all")}', 'TXT')
+        if dmarc_records:
             info["dmarc_records"] = [str(record) for record in dmarc_records]
-        except (dns.resolver.NoAnswer, dns.resolver.NXDOMAIN):
-            pass
 
         if _mx := info.get("mx_servers"):
             for server in _mx:
@@ -57,8 +60,140 @@ class EmailLookup(BaseModule, name="lookup"):
 
         return info
 
-    def run(self) -> None:
-        self.print_banner(SCAN_BANNER)
+    @staticmethod
+    def parse_email(email: str) -> dict:
+        address = parse_email_address(email)
+        if address is None:
+            return {"name": email.strip()}
+
+        info = {"name": address.local}
+        if address.label:
+            info["domain"] = address.label
+        info["tld"] = f".{address.suffix}"
+        info["domain_all"] = address.domain
+        if address.registrable:
+            info["registrable_domain"] = address.registrable
+
+        return info
+
+    @staticmethod
+    async def get_email_info_async(email: str, resolver: CachedResolver | None = None) -> dict:
+        info = EmailLookup.parse_email(email)
+        if domain := info.get("domain_all"):
+            info.update(await EmailLookup.get_domain_info(domain, resolver))
+        return info
+
+    @staticmethod
+    def get_email_info(email: str) -> dict:
+        return asyncio.run(EmailLookup.get_email_info_async(email))
+
+    @staticmethod
+    async def lookup_many_async(
+            emails: Iterable[str],
+            resolver: CachedResolver | None = None,
+            *,
+            concurrency: int = 32
+    ) -> AsyncIterator[dict]:
+        """
+        Looks up many addresses, resolving each mail domain once while it is in flight.
+
+        Addresses are read lazily and grouped by the domain being resolved,
+        records of every address of a domain are yielded as soon as that domain
+        is resolved. A domain that fails to resolve gives records with an
+        ``error`` key instead of stopping the batch. Pending queries are
+        cancelled when the caller stops iterating.
+
+        Parameters
+        ----------
+            emails : Iterable[str]
+                Email addresses, surrounding whitespace and blank entries are ignored.
+
+            resolver : CachedResolver | None
+                Resolver to use, the shared one by default.
+
+            concurrency : int
+                Number of domains resolved at the same time.
+        """
+        groups: dict[str, list[dict]] = {}
+        pending: dict[asyncio.Task, str] = {}
+
+        async def resolve(domain: str) -> dict:
+            try:
+                return await EmailLookup.get_domain_info(domain, resolver)
+            except Exception as e:
+                return {"error": f"{type(e).__name__}: {e}"}
+
+        def finished(tasks: Iterable[asyncio.Task]) -> Iterator[dict]:
+            for task in tasks:
+                domain = pending.pop(task)
+                domain_info = task.result()
+                for info in groups.pop(domain):
+                    yield {"email": f"{info.get('name')}@{domain}", **info, **domain_info}
+
+        try:
+            for email in emails:
+                if not (email := email.strip()):
+                    continue
+
+                info = EmailLookup.parse_email(email)
+                if (domain := info.get("domain_all")) is None:
+                    yield {"email": email, **info}
+                    continue
+
+                if domain in groups:
+                    groups[domain].append(info)
+                    continue
+
+                groups[domain] = [info]
+                pending[asyncio.ensure_future(resolve(domain))] = domain
+                if len(pending) >= concurrency:
+                    done, _ = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                else:
+                    # Let the queries progress while the input is read.
+                    await asyncio.sleep(0)
+                    done = [task for task in pending if task.done()]
+
+                for record in finished(done):
+                    yield record
+
+            while pending:
+                done, _ = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for record in finished(done):
+                    yield record
+        finally:
+            for task in pending:
+                task.cancel()
+            await asyncio.gather(*pending, return_exceptions=True)
+
+    def lookup_many(self, emails: Iterable[str], output: TextIO) -> int:
+        """Writes one JSON line per address to ``output`` and returns the number of records."""
+
+        async def write() -> int:
+            written = 0
+            async for record in self.lookup_many_async(emails):
+                output.write(json.dumps(record) + "\n")
+                written += 1
+            return written
+
+        return asyncio.run(write())
+
+    @classmethod
+    def add_arguments(cls, parser: ArgumentParser) -> None:
+        parser.add_argument("--concurrency", type=int, default=32, help="domains resolved at the same time")
+
+    def to_result(self, record: dict) -> Result:
+        error = record.pop("error", None)
+        return Result(module=self.command, target=record.pop("email"), source="dns", data=record, error=error)
+
+    def execute(self, params: Params) -> Iterator[Result]:
+        async def produce(emit: Callable[[dict], None]) -> None:
+            async for record in self.lookup_many_async(params.targets, concurrency=params.concurrency):
+                emit(record)
+
+        for record in iterate_emitted_async(produce):
+            yield self.to_result(record)
+
+    def run_single(self) -> None:
         print(log_colorize("Input email address", color=0x5386E5, prefix="<"), end="")
         email = input()
 
@@ -70,6 +205,47 @@ class EmailLookup(BaseModule, name="lookup"):
             else:
                 print(log_colorize(str(key).upper() + " : " + str(value), color=0x5386E5, prefix="+"))
 
+    def run_batch(self) -> None:
+        print(log_colorize("Input emails file path", color=0x5386E5, prefix="<"), end="")
+        emails_path = input().strip()
+
+        if not os.path.isfile(emails_path):
+            print(log_colorize("File not found", color=0x9487F4, prefix=">"))
+            return
+
+        print(log_colorize("Input output .jsonl file path", color=0x5386E5, prefix="<"), end="")
+        output_path = input().strip() or "lookup.jsonl"
+
+        with (
+            open(emails_path, encoding="UTF-8") as emails,
+            open(output_path, encoding="UTF-8", mode="a") as output
+        ):
+            written = self.lookup_many(emails, output)
+
+        resolver = get_resolver()
+        print(log_colorize(f"Records written: {written}", color=0x5386E5, prefix=">"))
+        print(log_colorize(
+            f"DNS queries: {resolver.misses}, cached: {resolver.hits}, shared: {resolver.shared}",
+            color=0x5386E5,
+            prefix=">"
+        ))
+
+    def run(self) -> None:
+        self.print_banner(SCAN_BANNER)
+
+        print(colorize("\n>          Single email (#1)", color=0x5386E5))
+        print(colorize(">          Emails file (#2)\n", color=0x5386E5))
+        print(log_colorize("Choice", color=0x5386E5, prefix="<"), end="")
+        choice = input().strip()
+
+        match choice:
+            case "1":
+                self.run_single()
+            case "2":
+                self.run_batch()
+            case _:
+                print(log_colorize("Invalid choice", color=0x9487F4, prefix=">"))
+
 
 def load() -> BaseModule:
     return EmailLookup()
@@ -1,14 +1,30 @@
+from __future__ import annotations
+
 import json
-from dataclasses import dataclass
-from typing import Optional
+import os
+import sys
+import threading
+import time
+from collections import defaultdict
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, as_completed, wait
+from contextlib import nullcontext
+from dataclasses import asdict, dataclass, replace
+from typing import TYPE_CHECKING, Any, Callable, ClassVar, Collection, Final, Iterable, Iterator, Optional, TextIO
 
 from bs4 import BeautifulSoup
 from fake_useragent import FakeUserAgent
 from requests import Session
 
-from utils import log_colorize
-from utils.abc import BaseModule
+from utils import colorize, log_colorize
+from utils.abc import BaseModule, Result, iterate_emitted, resource
 from utils.consts import OSINT_BANNER
+from utils.net import KeyedThrottle, TimeoutSession
+from utils.storage import Checkpoint, get_cache
+
+if TYPE_CHECKING:
+    from argparse import ArgumentParser
+
+CACHE_MODULE: Final[str] = "email"
 
 
 @dataclass
@@ -18,12 +34,374 @@ class Response:
     error: Optional[str]
 
 
-class EmailTracker(BaseModule, name="tracker"):
+class PreflightError(Exception):
+    """Raised when a provider cannot obtain its pre-flight token."""
+
+    def __init__(self, response: Response) -> None:
+        super().__init__(response.error)
+        self.response = response
+
+
+class TokenCache:
+    """
+    Thread-safe cache of provider pre-flight tokens with expiry.
+
+    Concurrent checks of the same provider wait for one fetch instead of
+    each fetching their own token.
+
+    Parameters
+    ----------
+        ttl : float
+            Default lifetime of a token in seconds.
+    """
+
+    def __init__(self, ttl: float = 600) -> None:
+        self.ttl = ttl
+        self.fetched = 0
+        self.reused = 0
+        self._tokens: dict[str, tuple[Any, float]] = {}
+        self._locks: defaultdict[str, threading.Lock] = defaultdict(threading.Lock)
+
+    def get(self, provider: str, fetch: Callable[[], Any], *, ttl: float | None = None) -> Any:
+        """Returns a valid token of the provider, calling ``fetch`` only if there is none."""
+        with self._locks[provider]:
+            entry = self._tokens.get(provider)
+            if entry is not None and entry[1] > time.monotonic():
+                self.reused += 1
+                return entry[0]
+
+            token = fetch()
+            self._tokens[provider] = (token, time.monotonic() + (self.ttl if ttl is None else ttl))
+            self.fetched += 1
+            return token
+
+    def invalidate(self, provider: str) -> None:
+        """Drops the token after the provider rejected it."""
+        self._tokens.pop(provider, None)
+
+    def summary(self) -> str:
+        return f"Pre-flight tokens fetched: {self.fetched}, reused: {self.reused} ({self.reused} requests saved)"
+
+
+@dataclass(frozen=True, slots=True)
+class Provider:
+    """
+    Email presence check of a single site.
+
+    Attributes
+    ----------
+        name : str
+            Unique provider name.
+
+        check : Callable[[EmailTracker, str], Response]
+            Performs the check for an email address.
+
+        cost : int
+            Number of requests made by one check.
+
+        preflight : str | None
+            Name of the token the provider has to fetch before checking.
+
+        rate_limit : float
+            Maximum number of checks per second, ``0`` disables the limit.
+
+        enabled : bool
+            Whether the provider runs by default.
+
+        token_ttl : float
+            Lifetime of the pre-flight token in seconds.
+    """
+    name: str
+    check: Callable[[EmailTracker, str], Response]
+    cost: int = 1
+    preflight: str | None = None
+    rate_limit: float = 0.0
+    enabled: bool = True
+    token_ttl: float = 600.0
+
+
+class ProviderRegistry:
+    """
+    Collection of email providers.
+
+    Example
+    -------
+        >>> @PROVIDERS.register("example", cost=1)
+        ... def try_example(tracker: EmailTracker, email: str) -> Response:
+        ...     ...
+    """
+
     def __init__(self) -> None:
-        self.session: Session = Session()
-        self._user_agent: FakeUserAgent = FakeUserAgent()
+        self._providers: dict[str, Provider] = {}
+
+    def add(self, provider: Provider) -> Provider:
+        if provider.name in self._providers:
+            raise ValueError(f"Provider {provider.name} is already registered")
+
+        self._providers[provider.name] = provider
+        return provider
+
+    def register(
+            self,
+            name: str,
+            *,
+            cost: int = 1,
+            preflight: str | None = None,
+            rate_limit: float = 0.0,
+            enabled: bool = True,
+            token_ttl: float = 600.0
+    ) -> Callable[[Callable[[EmailTracker, str], Response]], Callable[[EmailTracker, str], Response]]:
+        """Decorator registering a check function or an ``EmailTracker`` method."""
+
+        def decorator(check: Callable[[EmailTracker, str], Response]) -> Callable[[EmailTracker, str], Response]:
+            self.add(Provider(
+                name=name,
+                check=check,
+                cost=cost,
+                preflight=preflight,
+                rate_limit=rate_limit,
+                enabled=enabled,
+                token_ttl=token_ttl
+            ))
+            return check
+
+        return decorator
+
+    def set_enabled(self, name: str, enabled: bool) -> None:
+        self._providers[name] = replace(self._providers[name], enabled=enabled)
+
+    def scheduled(self, disabled: Collection[str] = ()) -> list[Provider]:
+        """Returns enabled providers, cheapest first."""
+        return sorted(
+            (
+                provider for provider in self._providers.values()
+                if provider.enabled and provider.name not in disabled
+            ),
+            key=lambda provider: provider.cost
+        )
+
+    def __getitem__(self, name: str) -> Provider:
+        return self._providers[name]
+
+    def __contains__(self, name: object) -> bool:
+        return name in self._providers
+
+    def __iter__(self) -> Iterator[Provider]:
+        return iter(self._providers.values())
+
+    def __len__(self) -> int:
+        return len(self._providers)
+
+
+PROVIDERS: Final[ProviderRegistry] = ProviderRegistry()
+
+
+class EmailTracker(BaseModule, name="tracker", command="email-tracker"):
+    providers: ClassVar[ProviderRegistry] = PROVIDERS
+
+    @dataclass(frozen=True, slots=True)
+    class Params:
+        """
+        Parameters
+        ----------
+            targets : Iterable[str]
+                Email addresses to check, consumed lazily.
+
+            window : int
+                Maximum number of provider checks in flight.
+        """
+        targets: Iterable[str]
+        window: int = 64
+
+    def __init__(self, *, timeout: float = 10, disabled: Collection[str] = ()) -> None:
+        self.timeout = timeout
+        self.disabled = frozenset(disabled)
+        self._throttle = KeyedThrottle()
+        self._sessions_lock = threading.Lock()
+
+    @resource
+    def tokens(self) -> TokenCache:
+        # Tokens are tied to the cookies of the sessions and released with them.
+        return TokenCache()
+
+    @resource
+    def sessions(self) -> dict[str, Session]:
+        return {}
+
+    @sessions.closer
+    def sessions(self, sessions: dict[str, Session]) -> None:
+        for session in sessions.values():
+            session.close()
+
+    @resource
+    def _user_agent(self) -> FakeUserAgent:
+        return FakeUserAgent()
+
+    def get_session(self, provider: str) -> Session:
+        """Returns the session of a provider, each provider keeps its own cookie jar."""
+        with self._sessions_lock:
+            if provider not in self.sessions:
+                self.sessions[provider] = TimeoutSession(self.timeout)
+            return self.sessions[provider]
+
+    def preflight(self, provider: str, fetch: Callable[[], Any]) -> Any:
+        """Returns the cached pre-flight token of the provider, fetching it when expired."""
+        ttl = self.providers[provider].token_ttl if provider in self.providers else None
+        return self.tokens.get(provider, fetch, ttl=ttl)
+
+    def try_provider(self, provider: Provider, email: str) -> Response:
+        try:
+            if provider.rate_limit > 0:
+                self._throttle.wait(provider.name, 1 / provider.rate_limit)
+            return provider.check(self, email)
+        except Exception as e:
+            return Response(
+                status_code=400,
+                message=None,
+                error=f"We get an exception while requesting: {e}."
+            )
+
+    def check(self, email: str) -> Iterator[tuple[str, Response]]:
+        """
+        Runs every provider concurrently and yields responses as they complete.
+
+        Cached answers are yielded first without touching the network, and
+        cheap providers are submitted before expensive ones.
+        """
+        cache = get_cache()
+        providers = self.providers.scheduled(self.disabled)
+
+        with ThreadPoolExecutor(max_workers=len(providers) or 1) as executor:
+            pending, cached = {}, []
+            for provider in providers:
+                if (entry := cache.get(CACHE_MODULE, provider.name, email)) is not None:
+                    cached.append((provider.name, Response(**entry)))
+                else:
+                    pending[executor.submit(self.try_provider, provider, email)] = provider
+
+            yield from cached
+
+            for future in as_completed(pending):
+                provider, response = pending[future], future.result()
+                if response.status_code == 200:
+                    cache.set(CACHE_MODULE, provider.name, email, asdict(response))
+
+                yield provider.name, response
+
+    def check_many(
+            self,
+            lines: Iterable[str],
+            output: TextIO | Callable[[dict[str, Any]], None],
+            *,
+            window: int = 64,
+            checkpoint: Checkpoint | None = None
+    ) -> int:
+        """
+        Checks a stream of email addresses, one per line, with bounded memory.
+
+        Lines are read lazily and at most ``window`` provider checks are in
+        flight at once. Every email x provider answer is written to ``output``
+        as a JSON line, or passed to it if it is a callable. With a checkpoint,
+        the number of fully written lines is saved about once a second and
+        skipped on the next call, so a crashed job resumes where it stopped.
+        Lines finished after the last save may be written twice.
+
+        Returns
+        -------
+            int
+                Number of written records.
+        """
+        cache = get_cache()
+        providers = self.providers.scheduled(self.disabled)
+        position = checkpoint.load().get("position", 0) if checkpoint else 0
+        start = position
+        remaining: dict[int, int] = {}
+        pending: dict[Future, tuple[int, str, Provider]] = {}
+        written = 0
+        next_save = time.monotonic() + 1
+        emit = output if callable(output) else lambda record: output.write(json.dumps(record) + "\n")
+        flush = getattr(output, "flush", lambda: None)
+
+        def write(number: int, email: str, provider: Provider, response: Response) -> None:
+            nonlocal written
+            emit({"email": email, "provider": provider.name, **asdict(response)})
+            remaining[number] -= 1
+            written += 1
+
+        def drain(block: bool) -> None:
+            nonlocal position, next_save
+            done = wait(pending, return_when=FIRST_COMPLETED).done if block else [f for f in pending if f.done()]
+            for future in done:
+                number, email, provider = pending.pop(future)
+                response = future.result()
+                if response.status_code == 200:
+                    cache.set(CACHE_MODULE, provider.name, email, asdict(response))
+                write(number, email, provider, response)
+
+            while remaining.get(position, -1) == 0:
+                del remaining[position]
+                position += 1
+
+            if checkpoint and time.monotonic() >= next_save:
+                flush()
+                checkpoint.save({"position": position})
+                next_save = time.monotonic() + 1
+
+        with ThreadPoolExecutor(max_workers=window) as executor:
+            for number, line in enumerate(lines):
+                if number < start:
+                    continue
 
+                # Counted up front, so the line is not finished before its last provider is submitted.
+                email = line.strip()
+                remaining[number] = len(providers) if email else 0
+                if email:
+                    for provider in providers:
+                        if (entry := cache.get(CACHE_MODULE, provider.name, email)) is not None:
+                            write(number, email, provider, Response(**entry))
+                        else:
+                            pending[executor.submit(self.try_provider, provider, email)] = (number, email, provider)
+
+                        while len(pending) >= window:
+                            drain(block=True)
+
+                drain(block=False)
+
+            while pending:
+                drain(block=True)
+
+        flush()
+        if checkpoint:
+            checkpoint.clear()
+
+        return written
+
+    @classmethod
+    def add_arguments(cls, parser: ArgumentParser) -> None:
+        parser.add_argument("--window", type=int, default=64, help="provider checks in flight")
+
+    def to_result(self, email: str, provider: str, response: Response) -> Result:
+        registered = response.message is not None if response.status_code == 200 else None
+        return Result(
+            module=self.command,
+            target=email,
+            source=provider,
+            found=registered,
+            data={"status_code": response.status_code, "message": response.message},
+            error=response.error if registered is None else None
+        )
+
+    def execute(self, params: Params) -> Iterator[Result]:
+        for record in iterate_emitted(lambda emit: self.check_many(params.targets, emit, window=params.window)):
+            yield self.to_result(
+                record["email"],
+                record["provider"],
+                Response(status_code=record["status_code"], message=record["message"], error=record["error"])
+            )
+
+    @PROVIDERS.register("instagram", cost=2, preflight="csrftoken")
     def try_instagram(self, email: str) -> Response:
+        session = self.get_session("instagram")
         headers: dict = {
             'User-Agent': self._user_agent.random,
             'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
@@ -33,31 +411,34 @@ class EmailTracker(BaseModule, name="tracker"):
             'Referer': 'https://www.instagram.com/'
         }
 
-        try:
-            response = self.session.get(
+        def fetch_token() -> str:
+            response = session.get(
                 "https://www.instagram.com/accounts/emailsignup/",
                 headers=headers
             )
-            if response.status_code == 200:
-                if 'csrftoken' in self.session.cookies:
-                    token = self.session.cookies['csrftoken']
-                else:
-                    return Response(
-                        status_code=response.status_code,
-                        message=None,
-                        error="Instagram signup token cannot be found in cookies."
-                    )
-            else:
-                return Response(
+            if response.status_code != 200:
+                raise PreflightError(Response(
                     status_code=response.status_code,
                     message=None,
                     error="Unable to process a status other than 200."
-                )
+                ))
+
+            if 'csrftoken' not in session.cookies:
+                raise PreflightError(Response(
+                    status_code=response.status_code,
+                    message=None,
+                    error="Instagram signup token cannot be found in cookies."
+                ))
+
+            return session.cookies['csrftoken']
+
+        try:
+            token = self.preflight("instagram", fetch_token)
 
             headers["x-csrftoken"] = token
             headers["Referer"] = "https://www.instagram.com/accounts/emailsignup/"
 
-            response = self.session.post(
+            response = session.post(
                 url="https://www.instagram.com/api/v1/web/accounts/web_create_ajax/attempt/",
                 headers=headers,
                 data={
@@ -81,11 +462,14 @@ class EmailTracker(BaseModule, name="tracker"):
                         error="Account not registered."
                     )
             else:
+                self.tokens.invalidate("instagram")
                 return Response(
                     status_code=response.status_code,
                     message=None,
                     error="Unknown status code."
                 )
+        except PreflightError as e:
+            return e.response
         except Exception as e:
             return Response(
                 status_code=400,
@@ -93,9 +477,11 @@ class EmailTracker(BaseModule, name="tracker"):
                 error=f"We get an exception while requesting: {e}."
             )
 
+    @PROVIDERS.register("x")
     def try_x(self, email: str) -> Response:
+        session = self.get_session("x")
         try:
-            response = self.session.get(
+            response = session.get(
                 url="https://api.x.com/i/users/email_available.json",
                 params={
                     "osint": email
@@ -127,9 +513,11 @@ class EmailTracker(BaseModule, name="tracker"):
                 error=f"We get an exception while requesting: {e}."
             )
 
+    @PROVIDERS.register("pinterest")
     def try_pinterest(self, email: str) -> Response:
+        session = self.get_session("pinterest")
         try:
-            response = self.session.get(
+            response = session.get(
                 "https://www.pinterest.com/_ngjs/resource/EmailExistsResource/get/",
                 params={
                     "source_url": "/",
@@ -164,7 +552,9 @@ class EmailTracker(BaseModule, name="tracker"):
                 error=f"We get an exception while requesting: {e}."
             )
 
+    @PROVIDERS.register("imgur")
     def try_imgur(self, email: str) -> Response:
+        session = self.get_session("imgur")
         headers = {
             'User-Agent': self._user_agent.random,
             'Accept': '*/*',
@@ -178,7 +568,7 @@ class EmailTracker(BaseModule, name="tracker"):
         }
 
         try:
-            response = self.session.post(
+            response = session.post(
                 'https://imgur.com/signin/ajax_email_available',
                 headers=headers,
                 data={
@@ -212,7 +602,9 @@ class EmailTracker(BaseModule, name="tracker"):
                 error=f"We get an exception while requesting: {e}."
             )
 
+    @PROVIDERS.register("patreon")
     def try_patreon(self, email: str) -> Response:
+        session = self.get_session("patreon")
         headers = {
             'User-Agent': self._user_agent.random,
             'Accept': '*/*',
@@ -225,7 +617,7 @@ class EmailTracker(BaseModule, name="tracker"):
         }
 
         try:
-            response = self.session.post(
+            response = session.post(
                 'https://www.plurk.com/Users/isEmailFound',
                 headers=headers,
                 data={
@@ -257,7 +649,9 @@ class EmailTracker(BaseModule, name="tracker"):
                 error=f"We get an exception while requesting: {e}."
             )
 
+    @PROVIDERS.register("spotify")
     def try_spotify(self, email: str) -> Response:
+        session = self.get_session("spotify")
         headers = {
             'User-Agent': self._user_agent.random,
             'Accept': 'application/json, text/plain, */*',
@@ -267,7 +661,7 @@ class EmailTracker(BaseModule, name="tracker"):
         }
 
         try:
-            response = self.session.get(
+            response = session.get(
                 'https://spclient.wg.spotify.com/signup/public/v1/account',
                 headers=headers,
                 params={
@@ -301,9 +695,11 @@ class EmailTracker(BaseModule, name="tracker"):
                 error=f"We get an exception while requesting: {e}."
             )
 
+    @PROVIDERS.register("firefox")
     def try_firefox(self, email: str) -> Response:
+        session = self.get_session("firefox")
         try:
-            response = self.session.post(
+            response = session.post(
                 "https://api.accounts.firefox.com/v1/account/status",
                 data={
                     "osint": email
@@ -336,7 +732,9 @@ class EmailTracker(BaseModule, name="tracker"):
                 error=f"We get an exception while requesting: {e}."
             )
 
+    @PROVIDERS.register("lastpass")
     def try_lastpass(self, email: str) -> Response:
+        session = self.get_session("lastpass")
         headers = {
             'User-Agent': self._user_agent.random,
             'Accept': '*/*',
@@ -349,7 +747,7 @@ class EmailTracker(BaseModule, name="tracker"):
         }
 
         try:
-            response = self.session.get(
+            response = session.get(
                 'https://lastpass.com/create_account.php',
                 params={
                     'check': 'avail',
@@ -386,7 +784,9 @@ class EmailTracker(BaseModule, name="tracker"):
                 error=f"We get an exception while requesting: {e}."
             )
 
+    @PROVIDERS.register("archive")
     def try_archive(self, email: str) -> Response:
+        session = self.get_session("archive")
         headers = {
             'User-Agent': self._user_agent.random,
             'Accept': '*/*',
@@ -403,7 +803,7 @@ class EmailTracker(BaseModule, name="tracker"):
             data = '-----------------------------\r\nContent-Disposition: form-data; name="input_name"\r\n\r\nusername\r\n-----------------------------\r\nContent-Disposition: form-data; name="input_value"\r\n\r\n' + email + \
                    '\r\n-----------------------------\r\nContent-Disposition: form-data; name="input_validator"\r\n\r\ntrue\r\n-----------------------------\r\nContent-Disposition: form-data; name="submit_by_js"\r\n\r\ntrue\r\n-------------------------------\r\n'
 
-            response = self.session.post(
+            response = session.post(
                 'https://archive.org/account/signup',
                 headers=headers,
                 data=data
@@ -434,7 +834,9 @@ class EmailTracker(BaseModule, name="tracker"):
                 error=f"We get an exception while requesting: {e}."
             )
 
+    @PROVIDERS.register("pornhub", cost=2, preflight="token")
     def try_pornhub(self, email: str) -> Response:
+        session = self.get_session("pornhub")
         headers = {
             'User-Agent': self._user_agent.random,
             'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
@@ -443,27 +845,30 @@ class EmailTracker(BaseModule, name="tracker"):
             'Connection': 'keep-alive',
             'Upgrade-Insecure-Requests': '1',
         }
-        try:
-            response = self.session.get("https://www.pornhub.com/signup", headers=headers)
-            if response.status_code == 200:
-                token = BeautifulSoup(response.content, features="html.parser").find(attrs={"name": "token"})
 
-                if token is None:
-                    return Response(
-                        status_code=400,
-                        message=None,
-                        error=f"PornHub token not found"
-                    )
-
-                token = token.get("value")
-            else:
-                return Response(
+        def fetch_token() -> str:
+            response = session.get("https://www.pornhub.com/signup", headers=headers)
+            if response.status_code != 200:
+                raise PreflightError(Response(
                     status_code=response.status_code,
                     message=None,
                     error=f"We get an exception while requesting: {response.text}."
-                )
+                ))
+
+            token = BeautifulSoup(response.content, features="html.parser").find(attrs={"name": "token"})
+            if token is None:
+                raise PreflightError(Response(
+                    status_code=400,
+                    message=None,
+                    error=f"PornHub token not found"
+                ))
+
+            return token.get("value")
 
-            response = self.session.post(
+        try:
+            token = self.preflight("pornhub", fetch_token)
+
+            response = session.post(
                 'https://www.pornhub.com/user/create_account_check',
                 headers=headers,
                 params={
@@ -491,11 +896,14 @@ class EmailTracker(BaseModule, name="tracker"):
                     error="Account not registered."
                 )
             else:
+                self.tokens.invalidate("pornhub")
                 return Response(
                     status_code=response.status_code,
                     message=None,
                     error="Unknown status code."
                 )
+        except PreflightError as e:
+            return e.response
         except Exception as e:
             return Response(
                 status_code=400,
@@ -503,7 +911,9 @@ class EmailTracker(BaseModule, name="tracker"):
                 error=f"We get an exception while requesting: {e}."
             )
 
+    @PROVIDERS.register("xnxx", cost=2, preflight="cookies")
     def try_xnxx(self, email: str) -> Response:
+        session = self.get_session("xnxx")
         headers = {
             'User-Agent': self._user_agent.random,
             'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
@@ -513,30 +923,28 @@ class EmailTracker(BaseModule, name="tracker"):
             'Referer': 'https://www.google.com/',
             'Connection': 'keep-alive'
         }
-        try:
-            response = self.session.get('https://www.xnxx.com', headers=headers)
 
-            if response.status_code == 200:
-                if not response:
-                    return Response(
-                        status_code=response.status_code,
-                        message=None,
-                        error="Cookie not found."
-                    )
-            else:
-                return Response(
+        def fetch_cookies() -> dict[str, str]:
+            response = session.get('https://www.xnxx.com', headers=headers)
+            if response.status_code != 200:
+                raise PreflightError(Response(
                     status_code=response.status_code,
                     message=None,
                     error="Unknown status code."
-                )
+                ))
+
+            return response.cookies.get_dict()
+
+        try:
+            cookies = self.preflight("xnxx", fetch_cookies)
 
             headers['Referer'] = 'https://www.xnxx.com/video-holehe/palenath_fucks_xnxx_with_holehe'
             headers['X-Requested-With'] = 'XMLHttpRequest'
 
-            response = self.session.get(
+            response = session.get(
                 f'https://www.xnxx.com/account/checkemail',
                 headers=headers,
-                cookies=response.cookies,
+                cookies=cookies,
                 params={
                     "osint": email
                 }
@@ -561,11 +969,14 @@ class EmailTracker(BaseModule, name="tracker"):
                     error="Account not registered."
                 )
             else:
+                self.tokens.invalidate("xnxx")
                 return Response(
                     status_code=response.status_code,
                     message=None,
                     error="Unknown status code."
                 )
+        except PreflightError as e:
+            return e.response
         except Exception as e:
             return Response(
                 status_code=400,
@@ -573,7 +984,9 @@ class EmailTracker(BaseModule, name="tracker"):
                 error=f"We get an exception while requesting: {e}."
             )
 
+    @PROVIDERS.register("xvideo")
     def try_xvideo(self, email: str) -> Response:
+        session = self.get_session("xvideo")
         headers = {
             'User-Agent': self._user_agent.random,
             'Accept': 'application/json, text/javascript, */*; q=0.01',
@@ -583,7 +996,7 @@ class EmailTracker(BaseModule, name="tracker"):
         }
 
         try:
-            response = self.session.get(
+            response = session.get(
                 'https://www.xvideos.com/account/checkemail',
                 headers=headers,
                 params={
@@ -622,34 +1035,66 @@ class EmailTracker(BaseModule, name="tracker"):
                 error=f"We get an exception while requesting: {e}."
             )
 
-    def run(self) -> None:
-        self.print_banner(OSINT_BANNER)
+    def run_single(self) -> None:
         print(log_colorize("Input email address", color=0x5386E5, prefix="<"), end="")
         email = input()
 
-        for site in [
-            "instagram",
-            "x",
-            "pinterest",
-            "imgur",
-            "patreon",
-            "spotify",
-            "firefox",
-            "lastpass",
-            "archive",
-            "pornhub",
-            "xnxx",
-            "xvideo"
-        ]:
-            try:
-                response = getattr(self, f"try_{site}")(email)
-                print(log_colorize(
-                    f"{site.upper()} : {response.message or response.error}",
-                    color=0x6BFF73 if not response.error else 0x9487F4,
-                    prefix="+" if not response.error else "-"
-                ))
-            except AttributeError:
-                continue
+        for site, response in self.check(email):
+            print(log_colorize(
+                f"{site.upper()} : {response.message or response.error}",
+                color=0x6BFF73 if not response.error else 0x9487F4,
+                prefix="+" if not response.error else "-"
+            ))
+
+    def run_bulk(self) -> None:
+        print(log_colorize("Input emails file path (- for stdin)", color=0x5386E5, prefix="<"), end="")
+        emails_path = input().strip()
+
+        if emails_path != "-" and not os.path.isfile(emails_path):
+            print(log_colorize("File not found", color=0x9487F4, prefix=">"))
+            return
+
+        print(log_colorize("Input output .jsonl file path", color=0x5386E5, prefix="<"), end="")
+        output_path = input().strip() or "emails.jsonl"
+
+        checkpoint = Checkpoint(f"{output_path}.checkpoint")
+        if checkpoint.exists():
+            print(log_colorize(
+                f"Resume from line {checkpoint.load().get('position', 0)}? (y/n)", color=0x5386E5, prefix="<"
+            ), end="")
+            if input().strip().lower() not in ["yes", "y"]:
+                checkpoint.clear()
+
+        print(log_colorize(f"Checking emails, results go to {output_path}...", color=0x5386E5, prefix=">"))
+        with (
+            open(output_path, encoding="UTF-8", mode="a") as output,
+            nullcontext(sys.stdin) if emails_path == "-" else open(emails_path, encoding="UTF-8") as lines
+        ):
+            written = self.check_many(lines, output, checkpoint=checkpoint)
+
+        print(log_colorize(f"Records written: {written}", color=0x5386E5, prefix=">"))
+
+    def run(self) -> None:
+        self.print_banner(OSINT_BANNER)
+
+        cache = get_cache()
+        cache.reset_stats()
+
+        print(colorize("\n>          Single email (#1)", color=0x5386E5))
+        print(colorize(">          Emails file (#2)\n", color=0x5386E5))
+        print(log_colorize("Choice", color=0x5386E5, prefix="<"), end="")
+        choice = input().strip()
+
+        match choice:
+            case "1":
+                self.run_single()
+            case "2":
+                self.run_bulk()
+            case _:
+                return print(log_colorize("Invalid choice", color=0x9487F4, prefix=">"))
+
+        print(log_colorize(cache.summary(), color=0x5386E5, prefix=">"))
+        print(log_colorize(self.tokens.summary(), color=0x5386E5, prefix=">"))
 
 
 def load() -> BaseModule:
@@ -0,0 +1,297 @@
+from __future__ import annotations
+
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, replace
+from typing import TYPE_CHECKING, Callable, Final, Iterable, Iterator
+
+from modules.network._whois import Whois
+from modules.osint.email.lookup import EmailLookup
+from modules.osint.email.tracker import EmailTracker
+from modules.osint.username.tracker import SITES_PATH, SiteRule, UsernameLookup
+from utils import log_colorize
+from utils.abc import BaseModule, Result, iterate_emitted_async, resource
+from utils.consts import OSINT_BANNER
+from utils.net import HostThrottle, KeyedThrottle, RateLimiter, create_session, get_resolver
+from utils.parsing import parse_email_address
+
+if TYPE_CHECKING:
+    from argparse import ArgumentParser
+
+STEPS: Final[tuple[str, ...]] = (EmailLookup.command, EmailTracker.command, UsernameLookup.command, Whois.command)
+
+
+class _SharedStep:
+    """Step running for one target, its results go to every subject that expanded to the target."""
+
+    __slots__ = ("subjects", "results", "task")
+
+    def __init__(self) -> None:
+        self.subjects: list[str] = []
+        self.results: list[Result] = []
+        self.task: asyncio.Future | None = None
+
+
+class Pipeline(BaseModule, name="pipeline"):
+    @dataclass(frozen=True, slots=True)
+    class Params:
+        """
+        Parameters
+        ----------
+            targets : Iterable[str]
+                Email addresses or usernames, consumed lazily.
+
+            steps : tuple[str, ...]
+                Commands of the modules to run, every applicable one by default.
+
+            sites_path : str
+                ``sites.json`` file with the username site rules.
+
+            sites : tuple[str, ...]
+                Only check these username sites, every site if empty.
+
+            rate : float
+                Global limit of username requests per second, ``0`` disables it.
+
+            host_delay : float
+                Minimum number of seconds between two username requests to the same host.
+
+            window : int
+                Number of targets investigated at the same time.
+
+            whois_delay : float
+                Minimum number of seconds between two queries to the same WHOIS registry.
+        """
+        targets: Iterable[str]
+        steps: tuple[str, ...] = STEPS
+        sites_path: str = SITES_PATH
+        sites: tuple[str, ...] = ()
+        rate: float = 100.0
+        host_delay: float = 0.5
+        window: int = 8
+        whois_delay: float = 1.0
+
+    def __init__(self, *, concurrency: int = 64, limit_per_host: int = 4, timeout: float = 10) -> None:
+        self.concurrency = concurrency
+        self.limit_per_host = limit_per_host
+        self.timeout = timeout
+
+    @resource
+    def email_lookup(self) -> EmailLookup:
+        return EmailLookup()
+
+    @resource
+    def email_tracker(self) -> EmailTracker:
+        return EmailTracker(timeout=self.timeout)
+
+    @email_tracker.closer
+    def email_tracker(self, tracker: EmailTracker) -> None:
+        tracker.release_resources()
+
+    @resource
+    def username_lookup(self) -> UsernameLookup:
+        return UsernameLookup(concurrency=self.concurrency, limit_per_host=self.limit_per_host, timeout=self.timeout)
+
+    @resource
+    def whois(self) -> Whois:
+        return Whois()
+
+    @staticmethod
+    def expand(subject: str) -> list[tuple[str, str]]:
+        """
+        Returns the ``(step, target)`` pairs an input is investigated with.
+
+        An email address is looked up and tracked as is, its local part without
+        a ``+tag`` is checked as a username and its registrable domain goes to
+        WHOIS. Anything else is a username.
+        """
+        address = parse_email_address(subject)
+        if address is None:
+            return [(UsernameLookup.command, subject.lower())]
+
+        email = f"{address.local}@{address.domain}"
+        pairs = [(EmailLookup.command, email), (EmailTracker.command, email)]
+        if username := address.local.split("+", 1)[0].lower():
+            pairs.append((UsernameLookup.command, username))
+        pairs.append((Whois.command, address.registrable or address.domain))
+        return pairs
+
+    async def investigate_async(
+            self,
+            subjects: Iterable[str],
+            rules: list[SiteRule],
+            emit: Callable[[Result], None],
+            *,
+            steps: Iterable[str] = STEPS,
+            rate: float = 100.0,
+            host_delay: float = 0.5,
+            window: int = 8,
+            whois_delay: float = 1.0
+    ) -> int:
+        """
+        Runs every step of every subject on the running loop and emits results as they arrive.
+
+        HTTP checks share one connection pool and DNS queries the shared
+        resolver, blocking modules run on one thread pool. A step requested by
+        several subjects while it runs, e.g. the username of two addresses or
+        the WHOIS of their common domain, runs once and its results are emitted
+        for each subject. Finished steps are forgotten, a later request hits
+        the result caches of the modules instead.
+
+        Returns
+        -------
+            int
+                Number of investigated subjects.
+        """
+        loop = asyncio.get_running_loop()
+        steps = frozenset(steps)
+        resolver = get_resolver()
+        limiter = RateLimiter(rate, burst=self.concurrency)
+        throttle = HostThrottle(concurrency=self.limit_per_host, delay=host_delay)
+        registries = KeyedThrottle(delay=whois_delay)
+        executor = ThreadPoolExecutor(max_workers=2 * window, thread_name_prefix="pipeline")
+        shared: dict[tuple[str, str], _SharedStep] = {}
+        seen: set[str] = set()
+        subjects = iter(subjects)
+        investigated = 0
+
+        async def run_step(step: str, target: str, publish: Callable[[Result], None]) -> None:
+            match step:
+                case EmailLookup.command:
+                    info = await EmailLookup.get_email_info_async(target, resolver)
+                    publish(self.email_lookup.to_result({"email": target, **info}))
+                case EmailTracker.command:
+                    tracker = self.email_tracker
+
+                    def check() -> None:
+                        for provider, response in tracker.check(target):
+                            loop.call_soon_threadsafe(publish, tracker.to_result(target, provider, response))
+
+                    await loop.run_in_executor(executor, check)
+                case UsernameLookup.command:
+                    lookup = self.username_lookup
+
+                    async def check_site(rule: SiteRule) -> None:
+                        publish(lookup.to_result(await lookup.check_pair(session, limiter, throttle, rule, target)))
+
+                    await asyncio.gather(*(check_site(rule) for rule in rules))
+                case Whois.command:
+                    publish(self.whois.to_result(await loop.run_in_executor(executor, Whois.lookup, target, registries)))
+
+        async def run_shared(step: str, target: str, entry: _SharedStep) -> None:
+            def publish(result: Result) -> None:
+                entry.results.append(result)
+                for subject in entry.subjects:
+                    emit(replace(result, subject=subject))
+
+            try:
+                await run_step(step, target, publish)
+            except Exception as e:
+                publish(Result(module=step, target=target, error=f"{type(e).__name__}: {e}"))
+
+        def share(step: str, target: str, subject: str) -> asyncio.Future:
+            key = (step, target)
+            if (entry := shared.get(key)) is None:
+                entry = shared[key] = _SharedStep()
+                entry.task = asyncio.ensure_future(run_shared(step, target, entry))
+                entry.task.add_done_callback(lambda _: shared.pop(key, None))
+
+            for result in entry.results:
+                emit(replace(result, subject=subject))
+            entry.subjects.append(subject)
+            # A subject giving up must not cancel the step for the others.
+            return asyncio.shield(entry.task)
+
+        async def worker() -> None:
+            nonlocal investigated
+            for subject in subjects:
+                if not (subject := subject.strip()) or subject in seen:
+                    continue
+
+                seen.add(subject)
+                await asyncio.gather(*(
+                    share(step, target, subject)
+                    for step, target in self.expand(subject)
+                    if step in steps
+                ))
+                investigated += 1
+
+        try:
+            async with create_session(
+                    limit=self.concurrency,
+                    limit_per_host=self.limit_per_host,
+                    timeout=self.timeout
+            ) as session:
+                await asyncio.gather(*(worker() for _ in range(window)))
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+        return investigated
+
+    @classmethod
+    def add_arguments(cls, parser: ArgumentParser) -> None:
+        parser.add_argument("--step", dest="steps", action="append", choices=STEPS, help="only run this module")
+        UsernameLookup.add_arguments(parser)
+        parser.add_argument("--window", type=int, default=8, help="targets investigated at the same time")
+        parser.add_argument("--whois-delay", type=float, default=1.0, help="seconds between queries to one registry")
+
+    def execute(self, params: Params) -> Iterator[Result]:
+        if unknown := set(params.steps) - set(STEPS):
+            raise ValueError(f"Unknown steps {', '.join(sorted(unknown))}, expected some of {', '.join(STEPS)}")
+
+        rules = []
+        if UsernameLookup.command in params.steps:
+            rules = self.username_lookup.select_rules(params.sites_path, params.sites)
+
+        yield from iterate_emitted_async(lambda emit: self.investigate_async(
+            params.targets,
+            rules,
+            emit,
+            steps=params.steps,
+            rate=params.rate,
+            host_delay=params.host_delay,
+            window=params.window,
+            whois_delay=params.whois_delay
+        ))
+
+    @staticmethod
+    def report(result: Result) -> None:
+        if result.error is not None or result.found is False:
+            return
+
+        match result.module:
+            case EmailLookup.command:
+                for key, value in result.data.items():
+                    value = " / ".join(value) if isinstance(value, list) else value
+                    print(log_colorize(f"{key.upper()} : {value}", color=0x5386E5, prefix="+"))
+            case Whois.command:
+                print(log_colorize(
+                    f"WHOIS {result.target.upper()} : {result.data.get('registrar') or 'registered'}",
+                    color=0x5386E5,
+                    prefix="+"
+                ))
+            case _:
+                detail = result.data.get("url") or result.data.get("message") or result.target
+                print(log_colorize(f"{result.source.upper()} : {detail}", color=0x6BFF73, prefix="+"))
+
+    def run(self) -> None:
+        self.print_banner(OSINT_BANNER)
+        print(log_colorize("Input email address or username", color=0x5386E5, prefix="<"), end="")
+        subject = input().strip()
+
+        found = 0
+        for result in self.execute(self.Params([subject])):
+            self.report(result)
+            found += result.found is True
+
+        print(log_colorize(f"Total found: {found}", color=0x5386E5, prefix=">"))
+
+
+def load() -> BaseModule:
+    return Pipeline()
+
+
+if __name__ == "__main__":
+    with load() as module:
+        module: BaseModule
+        module.run()
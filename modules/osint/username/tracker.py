@@ -1,119 +1,568 @@
+from __future__ import annotations
+
+import asyncio
 import json
-import re
+import os
 import threading
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import TYPE_CHECKING, Callable, Final, Iterable, Iterator, Literal, TextIO
+from urllib.parse import urlsplit
 
 import requests
-from bs4 import BeautifulSoup
 
-from utils import log_colorize
-from utils.abc import BaseModule
+from utils import colorize, log_colorize
+from utils.abc import BaseModule, Result, iterate_emitted_async
 from utils.consts import OSINT_BANNER
+from utils.net import HostThrottle, RateLimiter, create_session, read_prefix
+from utils.parsing import PageAnalysis, compile_indicators
+from utils.storage import get_cache
 
+if TYPE_CHECKING:
+    from argparse import ArgumentParser
 
-class UsernameLookup(BaseModule, name="lookup"):
-    def __init__(self) -> None:
-        self.founded: dict[str, str] = {}
+    from aiohttp import ClientSession
+
+
+CACHE_MODULE: Final[str] = "username"
+SITES_PATH: Final[str] = os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), "..", "..", "..", "data", "sites.json"
+)
+HEAD_UNSUPPORTED: Final[frozenset[int]] = frozenset({405, 501})
+
+
+class TransientStatusError(Exception):
+    """Raised for answers that say nothing about the profile, such as 429 or 503."""
+
+    def __init__(self, status_code: int) -> None:
+        super().__init__(f"Transient HTTP status {status_code}")
+        self.status_code = status_code
+
+
+def is_transient(status_code: int) -> bool:
+    """Whether a status means the site could not answer now: rate limited or failing."""
+    return status_code == 429 or status_code >= 500
+
+
+@dataclass(frozen=True, slots=True)
+class SiteRule:
+    """
+    Detection rules of a single site from ``sites.json``.
+
+    An entry is either a bare URL template or an object with the ``url`` key
+    and any of the optional keys below. Markers are matched case-insensitively
+    and ``{user}`` is replaced with the checked username.
+
+    Attributes
+    ----------
+        status : int
+            Status code of an existing profile, any other status means absent.
+
+        fetch_body : bool
+            Whether the body is needed at all; if not, the status code decides.
+
+        absent : tuple[str, ...]
+            Site-specific markers of a missing profile.
+
+        present : tuple[str, ...]
+            Markers proving that the profile exists.
+
+        strip : tuple[str, ...]
+            Fragments removed from the page before searching the username.
+
+        dom : bool
+            Build a full DOM instead of streaming the title and text.
+
+        max_bytes : int | None
+            Only the first bytes of the body are needed to decide.
+
+        head : bool
+            Whether a ``HEAD`` request answers with the same status as ``GET``.
+
+        ttl : float | None
+            Lifetime of a cached result in seconds, default of the cache if not set.
+    """
+    name: str
+    url: str
+    status: int = 200
+    fetch_body: bool = True
+    absent: tuple[str, ...] = ()
+    present: tuple[str, ...] = ()
+    strip: tuple[str, ...] = ()
+    dom: bool = False
+    max_bytes: int | None = None
+    head: bool = True
+    ttl: float | None = None
 
     @classmethod
-    def site_exception(cls, username: str, site: str, page_content: str) -> str:
-        match site:
-            case "Paypal":
-                page_content = (
-                    page_content.
-                    replace(f'slug_name={username}', '').
-                    replace(f'"slug":"{username}"', '').
-                    replace(f'2F{username}&amp', '')
-                )
-            case "TikTok":
-                page_content = page_content.replace(f'\\u002f@{username}"', '')
-
-        return page_content
+    def from_entry(cls, name: str, entry: str | dict) -> SiteRule:
+        if isinstance(entry, str):
+            return cls(name=name, url=entry)
+
+        return cls(
+            name=name,
+            url=entry["url"],
+            status=int(entry.get("status", 200)),
+            fetch_body=bool(entry.get("fetch_body", True)),
+            absent=tuple(marker.lower() for marker in entry.get("absent", ())),
+            present=tuple(marker.lower() for marker in entry.get("present", ())),
+            strip=tuple(pattern.lower() for pattern in entry.get("strip", ())),
+            dom=bool(entry.get("dom", False)),
+            max_bytes=entry.get("max_bytes"),
+            head=bool(entry.get("head", True)),
+            ttl=entry.get("ttl")
+        )
+
+    def format_url(self, username: str) -> str:
+        return self.url.replace("{user}", username)
+
+    @property
+    def read_limit(self) -> int | None:
+        """Number of body bytes needed to decide, ``None`` for the whole body."""
+        if not self.fetch_body:
+            return 0
+        return self.max_bytes
+
+
+@lru_cache(maxsize=8)
+def _compile_sites(file_path: str, mtime_ns: int) -> dict[str, SiteRule]:  # noqa
+    with open(file_path, encoding="UTF-8") as file:
+        return {name: SiteRule.from_entry(name, entry) for name, entry in json.load(file).items()}
+
+
+def load_sites(file_path: str) -> dict[str, SiteRule]:
+    """Returns the rule index of a ``sites.json`` file, parsed once per file modification."""
+    file_path = os.path.abspath(file_path)
+    return _compile_sites(file_path, os.stat(file_path).st_mtime_ns)
+
+
+class UsernameLookup(BaseModule, name="lookup", command="username"):
+    @dataclass(frozen=True, slots=True)
+    class Params:
+        """
+        Parameters
+        ----------
+            targets : Iterable[str]
+                Usernames to check, consumed lazily.
+
+            sites_path : str
+                ``sites.json`` file with the site rules.
+
+            sites : tuple[str, ...]
+                Only check these sites, every site if empty.
+
+            rate : float
+                Global limit of requests per second, ``0`` disables it.
+
+            host_delay : float
+                Minimum number of seconds between two requests to the same host.
+        """
+        targets: Iterable[str]
+        sites_path: str = SITES_PATH
+        sites: tuple[str, ...] = ()
+        rate: float = 100.0
+        host_delay: float = 0.5
+
+    NOT_FOUND_INDICATORS: Final[tuple[str, ...]] = (
+        "This profile could not be found",
+        "Sorry, this user was not found",
+        "Page Not Found",
+        "the profile was either removed ",
+        "The specified profile could not be found",
+        "doesn&apos;t&nbsp;exist",
+        "This page doesn't exist",
+        "404 Not Found",
+        "Sorry, nobody on Reddit goes by that name",
+        "The person may have been banned or the username is incorrect.",
+        "Some error occured while loading page for you. Please try again",
+        "No longer a registered user",
+        "No user ID specified or user does not exist!",
+        "user does not exist",
+        "User not found.",
+        "User was not found.",
+        "An error was encountered while processing your request",
+        "Sorry, the page you were looking for doesn’t exist",
+        "Wikipedia does not have a",
+        "We could not find the page you were looking for, so we found something to make you laugh to make up for it",
+        "Not Found!",
+        '"statusMsg":"","needFix"',
+        "is still available",
+    )
+
+    def __init__(
+            self,
+            *,
+            engine: Literal["async", "threads"] = "async",
+            concurrency: int = 64,
+            limit_per_host: int = 4,
+            timeout: float = 10,
+            probe: bool = True
+    ) -> None:
+        self.founded: dict[str, str] = {}
+        self.engine = engine
+        self.concurrency = concurrency
+        self.limit_per_host = limit_per_host
+        self.timeout = timeout
+        self.probe = probe
 
     @classmethod
-    def maybe_not_found(cls, text: str) -> bool:
-        soup = BeautifulSoup(text, "html.parser")
-        page_title = soup.title.string.strip() if soup.title else ""
-
-        for error_indicator in [
-            "This profile could not be found",
-            "Sorry, this user was not found",
-            "Page Not Found",
-            "the profile was either removed ",
-            "The specified profile could not be found",
-            "doesn&apos;t&nbsp;exist",
-            "This page doesn't exist",
-            "404 Not Found",
-            "Sorry, nobody on Reddit goes by that name",
-            "The person may have been banned or the username is incorrect.",
-            "Some error occured while loading page for you. Please try again",
-            "No longer a registered user",
-            "No user ID specified or user does not exist!",
-            "user does not exist",
-            "User not found.",
-            "User was not found.",
-            "An error was encountered while processing your request",
-            "Sorry, the page you were looking for doesn’t exist",
-            "Wikipedia does not have a",
-            "We could not find the page you were looking for, so we found something to make you laugh to make up for it",
-            "Not Found!",
-            '"statusMsg":"","needFix"',
-            "is still available",
-        ]:
-            if (
-                    error_indicator.lower() in text.lower()
-                    or error_indicator.lower() in page_title.lower()
-                    or page_title.lower() == "instagram"
-                    or page_title.lower() == "patreon logo"
-                    or "sign in" in page_title.lower()
-            ):
-                return True
-        return False
+    def maybe_not_found(cls, page: PageAnalysis, indicators: tuple[str, ...] = ()) -> bool:
+        page_title = page.title_lower
+        if (
+                page_title == "instagram"
+                or page_title == "patreon logo"
+                or "sign in" in page_title
+        ):
+            return True
+
+        matcher = compile_indicators(cls.NOT_FOUND_INDICATORS, indicators)
+        return bool(matcher.search(page.lower) or matcher.search(page_title))
 
     @staticmethod
-    def get_sites(file_path: str) -> dict[str, str]:
+    def get_sites(file_path: str) -> dict[str, SiteRule]:
         try:
-            with open(file_path, encoding="UTF-8", mode="r+") as file:
-                return json.load(file)
+            return load_sites(file_path)
         except FileNotFoundError:
             return {}
 
-    def check_site(self, site: str, url_template: str, username: str) -> None:
-        url = url_template.replace("{user}", username)
+    def inspect_page(self, rule: SiteRule, url: str, username: str, status_code: int, text: str) -> bool | None:
+        """
+        Decides whether the username exists from a fetched page.
+
+        Returns
+        -------
+            bool | None
+                ``True`` if found, ``False`` if the site reports a missing profile
+                and ``None`` if the page is inconclusive.
+
+        Raises
+        ------
+            TransientStatusError
+                The site rate limited the request or failed, try again later.
+        """
+        if status_code != rule.status:
+            if is_transient(status_code):
+                raise TransientStatusError(status_code)
+            return False
+
+        if not rule.fetch_body:
+            return True
+
+        page = PageAnalysis(text, dom=rule.dom)
+        if any(marker.replace("{user}", username) in page.lower for marker in rule.present):
+            return True
+
+        if self.maybe_not_found(page, rule.absent):
+            return False
+
+        if username in page.title_lower:
+            return True
+
+        page_content = page.stripped.replace(url, "").replace(f"/{username}", "")
+        for pattern in rule.strip:
+            page_content = page_content.replace(pattern.replace("{user}", username), "")
+
+        return (
+                username in page_content
+                or username in page.text_lower.replace(url, "")
+        ) or None
+
+    def report(self, site: str, url: str, verdict: bool | None) -> None:
+        if verdict:
+            self.founded[site] = url
+            print(log_colorize(f"{site.upper()} : {url}", color=0x6BFF73, prefix="+"))
+        elif verdict is False:
+            print(log_colorize(f"{site.upper()} not found", color=0x9487F4, prefix="@"))
+
+    def probe_headers(self, limit: int | None) -> dict[str, str] | None:
+        if not self.probe or limit is None:
+            return None
+        return {"Range": f"bytes=0-{max(limit, 1) - 1}"}
+
+    @staticmethod
+    def probe_status(status_code: int, headers: dict[str, str] | None) -> int:
+        # A partial answer to our own range request is a regular page.
+        return 200 if headers and status_code == 206 else status_code
+
+    def fetch(self, rule: SiteRule, url: str) -> tuple[int, str]:
+        """Fetches only as much of the profile page as the rule needs."""
+        limit = rule.read_limit
+        if self.probe and limit == 0 and rule.head:
+            response = requests.head(url, timeout=self.timeout, allow_redirects=True)
+            if response.status_code not in HEAD_UNSUPPORTED:
+                return response.status_code, ""
+
+        headers = self.probe_headers(limit)
+        with requests.get(url, timeout=self.timeout, stream=True, headers=headers) as response:
+            if limit is None:
+                text = response.text
+            else:
+                body = b""
+                if limit:
+                    for chunk in response.iter_content(chunk_size=min(limit, 16384)):
+                        body += chunk
+                        if len(body) >= limit:
+                            break
+                text = body[:limit].decode(response.encoding or "utf-8", errors="replace")
+
+        return self.probe_status(response.status_code, headers), text
+
+    async def fetch_async(self, session: ClientSession, rule: SiteRule, url: str) -> tuple[int, str]:
+        limit = rule.read_limit
+        if self.probe and limit == 0 and rule.head:
+            async with session.head(url, allow_redirects=True) as response:
+                if response.status not in HEAD_UNSUPPORTED:
+                    return response.status, ""
+
+        headers = self.probe_headers(limit)
+        async with session.get(url, headers=headers) as response:
+            if limit is None:
+                text = await response.text(errors="replace")
+            else:
+                body = await read_prefix(response, limit)
+                text = body.decode(response.charset or "utf-8", errors="replace")
+
+        return self.probe_status(response.status, headers), text
+
+    @staticmethod
+    def cached_verdict(rule: SiteRule, username: str) -> dict[str, bool | None] | None:
+        return get_cache().get(CACHE_MODULE, rule.name, username)
+
+    @staticmethod
+    def store_verdict(rule: SiteRule, username: str, verdict: bool | None) -> None:
+        # Only definite answers are cached, an inconclusive page is checked again next time.
+        if verdict is None:
+            return
+        get_cache().set(CACHE_MODULE, rule.name, username, {"found": verdict}, ttl=rule.ttl)
+
+    def check_site(self, rule: SiteRule, username: str) -> None:
+        url = rule.format_url(username)
+        if (cached := self.cached_verdict(rule, username)) is not None:
+            return self.report(rule.name, url, cached["found"])
+
         try:
-            response = requests.get(url, timeout=10)
-            if (
-                    response.status_code == 200
-                    and not self.maybe_not_found(response.text)
-            ):
-                page_content = re.sub(
-                    r'<[^>]*>', '',
-                    response.text.
-                    lower().
-                    replace(url, "").
-                    replace(f"/{username}", "")
-                )
-
-                page_content = self.site_exception(username, site, page_content)
-                page_text = BeautifulSoup(response.text, 'html.parser').get_text().lower().replace(url, "")
-                page_title = BeautifulSoup(response.content, 'html.parser').title.string.lower()
-
-                if (
-                        username in page_title
-                        or username in page_content
-                        or username in page_text
-                ):
-                    self.founded[site] = url
-                    print(log_colorize(f"{site.upper()} : {url}", color=0x6BFF73, prefix="+"))
-                return
+            status_code, text = self.fetch(rule, url)
+            verdict = self.inspect_page(rule, url, username, status_code, text)
+            self.store_verdict(rule, username, verdict)
         except Exception as e:
-            print(log_colorize(f"{site.upper()} : {e}", color=0x9487F4, prefix="@"))
+            print(log_colorize(f"{rule.name.upper()} : {e}", color=0x9487F4, prefix="@"))
         else:
-            print(log_colorize(f"{site.upper()} not found", color=0x9487F4, prefix="@"))
+            self.report(rule.name, url, verdict)
 
-    def run(self) -> None:
-        self.print_banner(OSINT_BANNER)
+    async def check_site_async(
+            self,
+            session: ClientSession,
+            semaphore: asyncio.Semaphore,
+            rule: SiteRule,
+            username: str
+    ) -> None:
+        url = rule.format_url(username)
+        if (cached := self.cached_verdict(rule, username)) is not None:
+            return self.report(rule.name, url, cached["found"])
+
+        try:
+            async with semaphore:
+                status_code, text = await self.fetch_async(session, rule, url)
+            verdict = self.inspect_page(rule, url, username, status_code, text)
+            self.store_verdict(rule, username, verdict)
+        except Exception as e:
+            print(log_colorize(f"{rule.name.upper()} : {e or type(e).__name__}", color=0x9487F4, prefix="@"))
+        else:
+            self.report(rule.name, url, verdict)
+
+    def sweep_threads(self, rules: list[SiteRule], username: str) -> None:
+        threads = []
+
+        for rule in rules:
+            thread = threading.Thread(target=self.check_site, args=(rule, username))
+            threads.append(thread)
+            thread.start()
+
+        for thread in threads:
+            thread.join()
+
+    async def sweep_async(self, rules: list[SiteRule], username: str) -> None:
+        semaphore = asyncio.Semaphore(self.concurrency)
+
+        async with create_session(
+                limit=self.concurrency,
+                limit_per_host=self.limit_per_host,
+                timeout=self.timeout
+        ) as session:
+            await asyncio.gather(*(
+                self.check_site_async(session, semaphore, rule, username)
+                for rule in rules
+            ))
+
+    def sweep(self, sites: dict[str, SiteRule | str], username: str) -> dict[str, str]:
+        """Checks the username against every site with the selected engine and returns found sites."""
         self.founded.clear()
+        rules = [
+            rule if isinstance(rule, SiteRule) else SiteRule.from_entry(site, rule)
+            for site, rule in sites.items()
+        ]
+
+        match self.engine:
+            case "threads":
+                self.sweep_threads(rules, username)
+            case "async":
+                asyncio.run(self.sweep_async(rules, username))
+            case _:
+                raise ValueError(f"Unknown engine {self.engine!r}")
+
+        return self.founded
 
+    async def check_pair(
+            self,
+            session: ClientSession,
+            limiter: RateLimiter,
+            throttle: HostThrottle,
+            rule: SiteRule,
+            username: str
+    ) -> dict[str, str | bool | None]:
+        url = rule.format_url(username)
+        record = {"username": username, "site": rule.name, "url": url, "found": None, "error": None}
+        if (cached := self.cached_verdict(rule, username)) is not None:
+            record["found"] = cached["found"]
+            return record
+
+        try:
+            await limiter.acquire()
+            async with throttle.slot(urlsplit(url).hostname or url):
+                status_code, text = await self.fetch_async(session, rule, url)
+            record["found"] = self.inspect_page(rule, url, username, status_code, text)
+            self.store_verdict(rule, username, record["found"])
+        except Exception as e:
+            record["error"] = str(e) or type(e).__name__
+        return record
+
+    async def sweep_many_async(
+            self,
+            usernames: Iterable[str],
+            rules: list[SiteRule],
+            emit: Callable[[dict[str, str | bool | None]], None],
+            *,
+            rate: float = 100.0,
+            host_delay: float = 0.5
+    ) -> tuple[int, int]:
+        # Username-major order interleaves hosts, so consecutive pairs rarely share a site.
+        pairs = ((rule, username) for username in usernames for rule in rules)
+        limiter = RateLimiter(rate, burst=self.concurrency)
+        throttle = HostThrottle(concurrency=self.limit_per_host, delay=host_delay)
+        checked = found = 0
+
+        async def worker() -> None:
+            nonlocal checked, found
+            for rule, username in pairs:
+                record = await self.check_pair(session, limiter, throttle, rule, username)
+                emit(record)
+                checked += 1
+                found += record["found"] is True
+
+        async with create_session(
+                limit=self.concurrency,
+                limit_per_host=self.limit_per_host,
+                timeout=self.timeout
+        ) as session:
+            await asyncio.gather(*(worker() for _ in range(self.concurrency)))
+
+        return checked, found
+
+    def sweep_many(
+            self,
+            usernames: Iterable[str],
+            sites: dict[str, SiteRule | str],
+            output: TextIO,
+            *,
+            rate: float = 100.0,
+            host_delay: float = 0.5
+    ) -> tuple[int, int]:
+        """
+        Checks every username against every site through one connection pool.
+
+        Each username x site pair is written to ``output`` as a JSON line as
+        soon as it is decided. Batches always use the asyncio engine.
+
+        Parameters
+        ----------
+            usernames : Iterable[str]
+                Usernames to check, consumed lazily.
+
+            sites : dict[str, SiteRule | str]
+                Site rules or bare URL templates.
+
+            output : TextIO
+                Stream receiving JSON Lines records.
+
+            rate : float
+                Global limit of requests per second, ``0`` disables it.
+
+            host_delay : float
+                Minimum number of seconds between two requests to the same host.
+
+        Returns
+        -------
+            tuple[int, int]
+                Number of checked pairs and number of found profiles.
+        """
+        rules = [
+            rule if isinstance(rule, SiteRule) else SiteRule.from_entry(site, rule)
+            for site, rule in sites.items()
+        ]
+        return asyncio.run(self.sweep_many_async(
+            usernames,
+            rules,
+            lambda record: output.write(json.dumps(record, ensure_ascii=False) + "\n"),
+            rate=rate,
+            host_delay=host_delay
+        ))
+
+    @staticmethod
+    def read_usernames(file_path: str) -> Iterator[str]:
+        seen = set()
+        with open(file_path, encoding="UTF-8") as file:
+            for line in file:
+                username = line.strip().lower()
+                if username and username not in seen:
+                    seen.add(username)
+                    yield username
+
+    @classmethod
+    def add_arguments(cls, parser: ArgumentParser) -> None:
+        parser.add_argument("--sites-file", dest="sites_path", default=SITES_PATH, help="sites.json with site rules")
+        parser.add_argument("--site", dest="sites", action="append", default=[], help="only check this site")
+        parser.add_argument("--rate", type=float, default=100.0, help="requests per second, 0 for no limit")
+        parser.add_argument("--host-delay", type=float, default=0.5, help="seconds between requests to one host")
+
+    def to_result(self, record: dict[str, str | bool | None]) -> Result:
+        return Result(
+            module=self.command,
+            target=record["username"],
+            source=record["site"],
+            found=record["found"],
+            data={"url": record["url"]},
+            error=record["error"]
+        )
+
+    def select_rules(self, sites_path: str, sites: Iterable[str] = ()) -> list[SiteRule]:
+        """Returns the rules of ``sites_path``, only those of ``sites`` if given, matched case-insensitively."""
+        rules = self.get_sites(sites_path)
+        if not rules:
+            raise FileNotFoundError(f"No site rules in {sites_path}")
+
+        wanted = {site.lower() for site in sites}
+        return [rule for name, rule in rules.items() if not wanted or name.lower() in wanted]
+
+    def execute(self, params: Params) -> Iterator[Result]:
+        rules = self.select_rules(params.sites_path, params.sites)
+        usernames = (username.strip().lower() for username in params.targets if username.strip())
+
+        for record in iterate_emitted_async(lambda emit: self.sweep_many_async(
+                usernames, rules, emit, rate=params.rate, host_delay=params.host_delay
+        )):
+            yield self.to_result(record)
+
+    def run_single(self) -> None:
         print(log_colorize("Input username", color=0x5386E5, prefix="<"), end="")
         username = input().lower()
 
@@ -125,15 +574,7 @@ class UsernameLookup(BaseModule, name="lookup"):
             print(log_colorize("Invalid sites.json file path", color=0x9487F4, prefix=">"))
             return
 
-        threads = []
-
-        for site, url_template in sites.items():
-            thread = threading.Thread(target=self.check_site, args=(site, url_template, username))
-            threads.append(thread)
-            thread.start()
-
-        for thread in threads:
-            thread.join()
+        self.sweep(sites, username)
 
         print()
 
@@ -146,6 +587,50 @@ class UsernameLookup(BaseModule, name="lookup"):
 
             print(log_colorize(f"Total found: {len(self.founded)}", color=0x5386E5, prefix=">"))
 
+        print(log_colorize(get_cache().summary(), color=0x5386E5, prefix=">"))
+
+    def run_batch(self) -> None:
+        print(log_colorize("Input usernames file path", color=0x5386E5, prefix="<"), end="")
+        usernames_path = input().strip()
+
+        if not os.path.isfile(usernames_path):
+            print(log_colorize("File not found", color=0x9487F4, prefix=">"))
+            return
+
+        print(log_colorize("Input sites.json file path", color=0x5386E5, prefix="<"), end="")
+        sites = self.get_sites(input().strip())
+        if not sites:
+            print(log_colorize("Invalid sites.json file path", color=0x9487F4, prefix=">"))
+            return
+
+        print(log_colorize("Input output .jsonl file path", color=0x5386E5, prefix="<"), end="")
+        output_path = input().strip() or "usernames.jsonl"
+
+        print(log_colorize(f"Checking usernames, results go to {output_path}...", color=0x5386E5, prefix=">"))
+        with open(output_path, encoding="UTF-8", mode="a") as output:
+            checked, found = self.sweep_many(self.read_usernames(usernames_path), sites, output)
+
+        print(log_colorize(f"Checked: {checked}, found: {found}", color=0x5386E5, prefix=">"))
+        print(log_colorize(get_cache().summary(), color=0x5386E5, prefix=">"))
+
+    def run(self) -> None:
+        self.print_banner(OSINT_BANNER)
+        self.founded.clear()
+        get_cache().reset_stats()
+
+        print(colorize("\n>          Single username (#1)", color=0x5386E5))
+        print(colorize(">          Usernames file (#2)\n", color=0x5386E5))
+        print(log_colorize("Choice", color=0x5386E5, prefix="<"), end="")
+        choice = input().strip()
+
+        match choice:
+            case "1":
+                self.run_single()
+            case "2":
+                self.run_batch()
+            case _:
+                print(log_colorize("Invalid choice", color=0x9487F4, prefix=">"))
+
 
 def load() -> BaseModule:
     return UsernameLookup()
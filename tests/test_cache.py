@@ -0,0 +1,68 @@
+from __future__ import annotations
+
+import itertools
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+from utils.storage import ResultCache
+
+
+class ResultCacheTest(unittest.TestCase):
+    def setUp(self) -> None:
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.path = os.path.join(directory.name, "results.sqlite3")
+
+        clock = mock.patch("utils.storage.cache.time", mock.Mock(time=itertools.count(1000).__next__))
+        clock.start()
+        self.addCleanup(clock.stop)
+
+    def accessed_at(self, cache: ResultCache, identifier: str) -> float:
+        (accessed_at,) = cache._connection.execute(
+            "SELECT accessed_at FROM results WHERE identifier = ?", (identifier,)
+        ).fetchone()
+        return accessed_at
+
+    def test_hits_do_not_write(self) -> None:
+        cache = ResultCache(self.path)
+        self.addCleanup(cache.close)
+        cache.set("username", "site", "alice", {"found": True})
+        written = self.accessed_at(cache, "alice")
+
+        self.assertEqual(cache.get("username", "site", "alice"), {"found": True})
+        self.assertEqual(self.accessed_at(cache, "alice"), written)
+
+        cache.flush()
+        self.assertGreater(self.accessed_at(cache, "alice"), written)
+
+    def test_eviction_keeps_recently_read_entries(self) -> None:
+        cache = ResultCache(self.path, max_entries=200)
+        self.addCleanup(cache.close)
+        for number in range(200):
+            cache.set("username", "site", str(number), number)
+        for number in range(0, 200, 2):
+            cache.get("username", "site", str(number))
+
+        # The last write evicts the oldest entries down to 180.
+        for number in range(200, ResultCache._EVICT_EVERY):
+            cache.set("username", "site", str(number), number)
+
+        kept = {number for number in range(200) if cache.get("username", "site", str(number)) is not None}
+        self.assertEqual(len(kept), 180 - (ResultCache._EVICT_EVERY - 200))
+        self.assertLessEqual(set(range(0, 200, 2)), kept)
+
+    def test_close_writes_access_times(self) -> None:
+        cache = ResultCache(self.path)
+        cache.set("email", "provider", "user@example.com", "registered")
+        cache.get("email", "provider", "user@example.com")
+        cache.close()
+
+        cache = ResultCache(self.path)
+        self.addCleanup(cache.close)
+        self.assertEqual(self.accessed_at(cache, "user@example.com"), 1001)
+
+
+if __name__ == "__main__":
+    unittest.main()
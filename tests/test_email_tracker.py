@@ -0,0 +1,89 @@
+from __future__ import annotations
+
+import itertools
+import os
+import tempfile
+import unittest
+from collections import Counter
+from typing import Any
+from unittest import mock
+
+from modules.osint.email.tracker import EmailTracker, ProviderRegistry, Response
+from utils.storage import Checkpoint, configure_cache, get_cache
+from utils.storage.cache import CACHE_DIRECTORY
+
+PROVIDERS = ProviderRegistry()
+for _name in ("first", "second", "third"):
+    PROVIDERS.register(_name)(lambda tracker, email: Response(status_code=200, message="registered", error=None))
+
+
+class FakeTracker(EmailTracker, name="fake-tracker"):
+    providers = PROVIDERS
+
+
+class RecordingCheckpoint(Checkpoint):
+    """Checkpoint remembering the results written before each save."""
+
+    def __init__(self, path: str, records: list[dict[str, Any]]) -> None:
+        super().__init__(path)
+        self.records = records
+        self.saves: list[tuple[int, Counter[str]]] = []
+
+    def save(self, state: dict[str, Any]) -> None:
+        self.saves.append((state["position"], Counter(record["email"] for record in self.records)))
+        super().save(state)
+
+
+class CheckManyTest(unittest.TestCase):
+    def setUp(self) -> None:
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.directory = directory.name
+
+        configure_cache(path=os.path.join(self.directory, "results.sqlite3"))
+        self.addCleanup(configure_cache, path=os.path.join(CACHE_DIRECTORY, "results.sqlite3"))
+
+        # Every drain sees a second elapsed and saves the checkpoint.
+        clock = mock.patch("modules.osint.email.tracker.time", mock.Mock(monotonic=itertools.count(step=2).__next__))
+        clock.start()
+        self.addCleanup(clock.stop)
+
+        self.emails = [f"user{number}@example.com" for number in range(10)]
+        # Cached answers complete a line without going through the pool.
+        for email in self.emails[::3]:
+            get_cache().set("email", "second", email, {"status_code": 200, "message": "cached", "error": None})
+
+    def test_small_window_emits_every_result(self) -> None:
+        for window in (1, 2, 3):
+            with self.subTest(window=window):
+                records = []
+                checkpoint = RecordingCheckpoint(os.path.join(self.directory, f"{window}.checkpoint"), records)
+
+                written = FakeTracker().check_many(
+                    [*self.emails[:5], "", *self.emails[5:]], records.append, window=window, checkpoint=checkpoint
+                )
+
+                self.assertEqual(written, 3 * len(self.emails))
+                self.assertEqual(Counter(record["email"] for record in records), Counter(self.emails * 3))
+                self.assertFalse(checkpoint.exists())
+
+                lines = [*self.emails[:5], "", *self.emails[5:]]
+                self.assertTrue(checkpoint.saves)
+                for position, emitted in checkpoint.saves:
+                    for email in lines[:position]:
+                        if email:
+                            self.assertEqual(emitted[email], 3, f"line of {email} saved before it finished")
+
+    def test_resume_skips_saved_lines(self) -> None:
+        records = []
+        checkpoint = Checkpoint(os.path.join(self.directory, "resume.checkpoint"))
+        checkpoint.save({"position": 4})
+
+        FakeTracker().check_many(self.emails, records.append, window=1, checkpoint=checkpoint)
+
+        self.assertEqual(Counter(record["email"] for record in records), Counter(self.emails[4:] * 3))
+        self.assertFalse(checkpoint.exists())
+
+
+if __name__ == "__main__":
+    unittest.main()
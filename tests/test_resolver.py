@@ -0,0 +1,151 @@
+from __future__ import annotations
+
+import asyncio
+import socket
+import threading
+import time
+import unittest
+from collections import Counter
+from unittest import mock
+
+import dns.message
+import dns.rcode
+import dns.rdatatype
+import dns.rrset
+
+from utils.net import CachedResolver
+
+ZONE = {
+    ("example.com.", "MX"): (120, ["10 mail.example.com."]),
+    ("long.example.com.", "TXT"): (3600, ['"v=spf1 -all"'])
+}
+SOA = "ns1.example.com. admin.example.com. 1 900 900 1800 30"
+
+
+class StubNameserver:
+    """
+    UDP nameserver answering from ``ZONE`` and counting the queries it receives.
+
+    Names under ``example.com`` without records give an empty answer and
+    other names NXDOMAIN, both with an SOA of TTL 60 and minimum 30.
+    """
+
+    def __init__(self, delay: float = 0.05) -> None:
+        self.delay = delay
+        self.queries: Counter[tuple[str, str]] = Counter()
+        self._socket = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        self._socket.bind(("127.0.0.1", 0))
+        self._socket.settimeout(0.1)
+        self._stopped = threading.Event()
+        self._thread = threading.Thread(target=self._serve, daemon=True)
+
+    @property
+    def port(self) -> int:
+        return self._socket.getsockname()[1]
+
+    def _answer(self, query: dns.message.Message) -> dns.message.Message:
+        response = dns.message.make_response(query)
+        question = query.question[0]
+        name, rdtype = question.name.to_text(), dns.rdatatype.to_text(question.rdtype)
+        self.queries[(name, rdtype)] += 1
+
+        if (name, rdtype) in ZONE:
+            ttl, records = ZONE[(name, rdtype)]
+            response.answer.append(dns.rrset.from_text(question.name, ttl, "IN", rdtype, *records))
+        else:
+            if not name.endswith("example.com."):
+                response.set_rcode(dns.rcode.NXDOMAIN)
+            response.authority.append(dns.rrset.from_text("example.com.", 60, "IN", "SOA", SOA))
+        return response
+
+    def _serve(self) -> None:
+        while not self._stopped.is_set():
+            try:
+                data, address = self._socket.recvfrom(4096)
+            except socket.timeout:
+                continue
+
+            time.sleep(self.delay)
+            self._socket.sendto(self._answer(dns.message.from_wire(data)).to_wire(), address)
+
+    def start(self) -> None:
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stopped.set()
+        self._thread.join()
+        self._socket.close()
+
+
+class CachedResolverTest(unittest.IsolatedAsyncioTestCase):
+    def setUp(self) -> None:
+        self.server = StubNameserver()
+        self.server.start()
+        self.addCleanup(self.server.stop)
+
+        # Only the cache clock is faked, the resolver and the loop keep the real one.
+        self.now = 1000.0
+        clock = mock.patch("utils.net.resolver.time", mock.Mock(monotonic=lambda: self.now))
+        clock.start()
+        self.addCleanup(clock.stop)
+
+    def resolver(self, **options) -> CachedResolver:
+        return CachedResolver(nameservers=["127.0.0.1"], port=self.server.port, **options)
+
+    async def test_positive_answer_cached_for_its_ttl(self) -> None:
+        resolver = self.resolver()
+
+        records = await resolver.resolve("example.com", "MX")
+        self.assertEqual([str(record.exchange) for record in records], ["mail.example.com."])
+
+        self.now += 119
+        await resolver.resolve("EXAMPLE.com.", "mx")
+        self.assertEqual(self.server.queries[("example.com.", "MX")], 1)
+        self.assertEqual((resolver.misses, resolver.hits), (1, 1))
+
+        self.now += 2
+        await resolver.resolve("example.com", "MX")
+        self.assertEqual(self.server.queries[("example.com.", "MX")], 2)
+
+    async def test_negative_answer_cached_for_soa_minimum(self) -> None:
+        resolver = self.resolver(negative_ttl=300)
+
+        for name, rdtype in (("_dmarc.example.com", "TXT"), ("missing.test", "A")):
+            self.assertEqual(await resolver.resolve(name, rdtype), ())
+
+        self.now += 29
+        for name, rdtype in (("_dmarc.example.com", "TXT"), ("missing.test", "A")):
+            await resolver.resolve(name, rdtype)
+        self.assertEqual(self.server.queries[("_dmarc.example.com.", "TXT")], 1)
+        self.assertEqual(self.server.queries[("missing.test.", "A")], 1)
+
+        self.now += 2
+        for name, rdtype in (("_dmarc.example.com", "TXT"), ("missing.test", "A")):
+            await resolver.resolve(name, rdtype)
+        self.assertEqual(self.server.queries[("_dmarc.example.com.", "TXT")], 2)
+        self.assertEqual(self.server.queries[("missing.test.", "A")], 2)
+
+    async def test_concurrent_queries_share_one_request(self) -> None:
+        resolver = self.resolver()
+
+        answers = await asyncio.gather(*(resolver.resolve("example.com", "MX") for _ in range(5)))
+
+        self.assertEqual(len({tuple(map(str, answer)) for answer in answers}), 1)
+        self.assertEqual(self.server.queries[("example.com.", "MX")], 1)
+        self.assertEqual((resolver.misses, resolver.shared), (1, 4))
+
+    async def test_ttl_capped_by_max_ttl(self) -> None:
+        resolver = self.resolver(max_ttl=10)
+
+        await resolver.resolve("long.example.com", "TXT")
+        self.now += 9
+        await resolver.resolve("long.example.com", "TXT")
+        self.assertEqual(self.server.queries[("long.example.com.", "TXT")], 1)
+
+        self.now += 2
+        await resolver.resolve("long.example.com", "TXT")
+        self.assertEqual(self.server.queries[("long.example.com.", "TXT")], 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
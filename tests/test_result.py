@@ -0,0 +1,67 @@
+from __future__ import annotations
+
+import asyncio
+import time
+import unittest
+
+from utils.abc import iterate_emitted_async
+
+
+class IterateEmittedAsyncTest(unittest.TestCase):
+    def test_slow_consumer_does_not_block_loop(self) -> None:
+        delays = []
+
+        async def produce(emit) -> None:
+            async def tick() -> None:
+                for _ in range(10):
+                    started = time.monotonic()
+                    await asyncio.sleep(0.01)
+                    delays.append(time.monotonic() - started)
+
+            ticker = asyncio.create_task(tick())
+            for number in range(100):
+                emit(number)
+            await ticker
+
+        items = []
+        for item in iterate_emitted_async(produce, buffer=1):
+            items.append(item)
+            time.sleep(0.005)
+
+        self.assertEqual(items, list(range(100)))
+        # Blocking emit would hold the loop for the whole 0.5 s of consuming.
+        self.assertLess(max(delays), 0.2)
+
+    def test_close_stops_producer(self) -> None:
+        emitted = []
+
+        async def produce(emit) -> None:
+            number = 0
+            while True:
+                emit(number)
+                emitted.append(number)
+                number += 1
+                await asyncio.sleep(0)
+
+        iterator = iterate_emitted_async(produce, buffer=1)
+        self.assertEqual([next(iterator), next(iterator)], [0, 1])
+        iterator.close()
+
+        count = len(emitted)
+        time.sleep(0.05)
+        self.assertEqual(len(emitted), count)
+
+    def test_producer_error_raised_after_items(self) -> None:
+        async def produce(emit) -> None:
+            emit(1)
+            raise ValueError("broken")
+
+        items = []
+        with self.assertRaisesRegex(ValueError, "broken"):
+            for item in iterate_emitted_async(produce):
+                items.append(item)
+        self.assertEqual(items, [1])
+
+
+if __name__ == "__main__":
+    unittest.main()
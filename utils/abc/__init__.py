@@ -1 +1,3 @@
 from .module import *
+from .resource import *
+from .result import *
@@ -1,22 +1,37 @@
 from __future__ import annotations
 
 from abc import abstractmethod, ABC
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any, ClassVar, Iterator
+
+from .resource import resource
 
 if TYPE_CHECKING:
+    from argparse import ArgumentParser
     from types import TracebackType
 
+    from .result import Result
+
 __all__ = [
     "BaseModule"
 ]
 
 
 class BaseModule(ABC):
+    command: ClassVar[str]
+    Params: ClassVar[type | None] = None
+
     def __init_subclass__(cls, **kwargs: any) -> None:
         if "name" not in kwargs:
             raise ValueError(f"name query parameter")
 
         cls.name = kwargs.pop("name")
+        cls.command = kwargs.pop("command", None) or cls.name
+        cls.resources = tuple({
+            name: attribute
+            for klass in reversed(cls.__mro__)
+            for name, attribute in vars(klass).items()
+            if isinstance(attribute, resource)
+        }.values())
         super().__init_subclass__(**kwargs)
 
     def __enter__(self) -> BaseModule:
@@ -25,10 +40,31 @@ class BaseModule(ABC):
 
     def __exit__(self, exc_type: type, exc_val: Exception, exc_tb: 'TracebackType') -> None:
         self.now = False
+        self.release_resources()
+
+    def release_resources(self) -> None:
+        """Releases every resource built so far, they are built again on next access."""
+        for attribute in self.resources:
+            attribute.release(self)
 
     @abstractmethod
     def run(self) -> None: ...
 
+    @classmethod
+    def add_arguments(cls, parser: ArgumentParser) -> None:
+        """Declares command line options, their ``dest`` matches the fields of ``Params``."""
+
+    @abstractmethod
+    def execute(self, params: Any) -> Iterator[Result]:
+        """
+        Runs the module without prompts and yields results as they arrive.
+
+        Parameters
+        ----------
+            params : Params
+                Instance of the ``Params`` dataclass of the module.
+        """
+
     @staticmethod
     def print_banner(banner: str) -> None:
         from utils import gradient_colorize
@@ -0,0 +1,62 @@
+from __future__ import annotations
+
+import threading
+from typing import Any, Callable, Generic, TypeVar
+
+__all__ = [
+    "resource"
+]
+
+T = TypeVar("T")
+
+
+class resource(Generic[T]):  # noqa
+    """
+    Module attribute built on first access and released when the module context exits.
+
+    Works like ``functools.cached_property``, except that ``BaseModule.__exit__``
+    drops every built resource and calls its closer, so a module instance
+    stays cheap until it is used and can be entered again later.
+
+    Example
+    -------
+        >>> class Tracker(BaseModule, name="tracker"):
+        ...     @resource
+        ...     def session(self) -> Session:
+        ...         return Session()
+        ...
+        ...     @session.closer
+        ...     def session(self, session: Session) -> None:
+        ...         session.close()
+    """
+
+    def __init__(self, factory: Callable[[Any], T]) -> None:
+        self.factory = factory
+        self.close: Callable[[Any, T], None] | None = None
+        self.name = factory.__name__
+        self.__doc__ = factory.__doc__
+        self._lock = threading.RLock()
+
+    def __set_name__(self, owner: type, name: str) -> None:
+        self.name = name
+
+    def closer(self, close: Callable[[Any, T], None]) -> resource[T]:
+        self.close = close
+        return self
+
+    def __get__(self, instance: Any, owner: type | None = None) -> T | resource[T]:
+        if instance is None:
+            return self
+
+        with self._lock:
+            if self.name not in instance.__dict__:
+                instance.__dict__[self.name] = self.factory(instance)
+            return instance.__dict__[self.name]
+
+    def release(self, instance: Any) -> None:
+        """Closes the built value, the next access builds a new one."""
+        with self._lock:
+            value = instance.__dict__.pop(self.name, None)
+
+        if value is not None and self.close is not None:
+            self.close(instance, value)
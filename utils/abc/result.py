@@ -0,0 +1,179 @@
+from __future__ import annotations
+
+import asyncio
+import queue
+import threading
+from dataclasses import asdict, dataclass, field
+from typing import Any, Awaitable, Callable, Iterator, TypeVar
+
+__all__ = [
+    "Result",
+    "iterate_emitted",
+    "iterate_emitted_async"
+]
+
+T = TypeVar("T")
+
+
+@dataclass(frozen=True, slots=True)
+class Result:
+    """
+    One answer of a module about one target, as returned by ``BaseModule.execute``.
+
+    Parameters
+    ----------
+        module : str
+            Command of the module that produced the result.
+
+        target : str
+            Username, email, domain, URL or file the answer is about.
+
+        source : str | None
+            Site, provider or check that gave the answer.
+
+        found : bool | None
+            Whether the target was found, ``None`` if the answer is unknown.
+
+        data : dict[str, Any]
+            Module-specific details, JSON serializable.
+
+        error : str | None
+            Why no answer could be given.
+
+        subject : str | None
+            Input the target was derived from, set when a pipeline expands one input into several targets.
+    """
+    module: str
+    target: str
+    source: str | None = None
+    found: bool | None = None
+    data: dict[str, Any] = field(default_factory=dict)
+    error: str | None = None
+    subject: str | None = None
+
+    def to_dict(self) -> dict[str, Any]:
+        return asdict(self)
+
+
+class _Closed(BaseException):
+    """Raised into a producer whose consumer stopped iterating, like ``GeneratorExit``."""
+
+
+def iterate_emitted(producer: Callable[[Callable[[T], None]], Any], *, buffer: int = 1024) -> Iterator[T]:
+    """
+    Turns a callback-based producer into an iterator.
+
+    The producer runs in a worker thread and hands every item to the
+    ``emit`` callback it receives. Items are yielded as soon as they are
+    emitted. ``emit`` blocks while ``buffer`` items wait, and raises once
+    the consumer closes the iterator, which stops the producer. Coroutine
+    producers use ``iterate_emitted_async``, which never blocks their loop.
+
+    Example
+    -------
+        >>> list(iterate_emitted(lambda emit: [emit(i) for i in range(3)]))
+        [0, 1, 2]
+    """
+    items: queue.Queue = queue.Queue(maxsize=buffer)
+    closed = threading.Event()
+    done = object()
+    failure: list[BaseException] = []
+
+    def emit(item: T) -> None:
+        while not closed.is_set():
+            try:
+                items.put(item, timeout=0.1)
+                return
+            except queue.Full:
+                continue
+        raise _Closed
+
+    def work() -> None:
+        try:
+            producer(emit)
+        except _Closed:
+            pass
+        except BaseException as e:
+            failure.append(e)
+        finally:
+            while not closed.is_set():
+                try:
+                    items.put(done, timeout=0.1)
+                    break
+                except queue.Full:
+                    continue
+
+    worker = threading.Thread(target=work, name="result-producer", daemon=True)
+    worker.start()
+    try:
+        while (item := items.get()) is not done:
+            yield item
+    finally:
+        closed.set()
+        worker.join()
+
+    if failure:
+        raise failure[0]
+
+
+async def _forward(producer: Callable[[Callable[[T], None]], Awaitable[Any]], put: Callable[[T], None]) -> None:
+    loop = asyncio.get_running_loop()
+    items: asyncio.Queue = asyncio.Queue()
+    done = object()
+
+    def put_all(batch: list[T]) -> None:
+        for item in batch:
+            put(item)
+
+    async def forward() -> None:
+        while True:
+            batch = [await items.get()]
+            while not items.empty():
+                batch.append(items.get_nowait())
+
+            finished = batch[-1] is done
+            if finished:
+                batch.pop()
+            if batch:
+                # Waits for room in the consumer queue on a thread, the loop keeps running.
+                await loop.run_in_executor(None, put_all, batch)
+            if finished:
+                return
+
+    forwarder = asyncio.create_task(forward())
+
+    def emit(item: T) -> None:
+        if forwarder.done():
+            # The consumer closed the iterator, raise its _Closed into the producer.
+            forwarder.result()
+        items.put_nowait(item)
+
+    try:
+        await producer(emit)
+    finally:
+        items.put_nowait(done)
+        await forwarder
+
+
+def iterate_emitted_async(
+        producer: Callable[[Callable[[T], None]], Awaitable[Any]],
+        *,
+        buffer: int = 1024
+) -> Iterator[T]:
+    """
+    Turns a coroutine producer into an iterator, see ``iterate_emitted``.
+
+    The producer runs with ``asyncio.run`` in a worker thread. Its ``emit``
+    callback never blocks the event loop: items wait on the loop while the
+    consumer is slow and are handed over in batches, so in-flight requests
+    keep running and do not time out behind a slow output.
+
+    Example
+    -------
+        >>> async def produce(emit):
+        ...     for i in range(3):
+        ...         emit(i)
+        >>> list(iterate_emitted_async(produce))
+        [0, 1, 2]
+    """
+    return iterate_emitted(lambda put: asyncio.run(_forward(producer, put)), buffer=buffer)
@@ -5,7 +5,12 @@ __all__ = [
     "gradient_colorize"
 ]
 
-from datetime import datetime
+import time
+from functools import lru_cache
+
+RESET = "\033[0m"
+
+_clock: tuple[int, str] = (-1, "")
 
 
 def hex_to_rgb(hex_color: int) -> tuple[int, ...]:
@@ -35,6 +40,35 @@ def hex_to_rgb(hex_color: int) -> tuple[int, ...]:
     return tuple(int(hex_color[i:i + 2], 16) for i in (0, 2, 4))
 
 
+@lru_cache(maxsize=256)
+def _escape(color: int) -> str:
+    r, g, b = hex_to_rgb(color)
+    return f"\033[38;2;{r};{g};{b}m"
+
+
+@lru_cache(maxsize=256)
+def _log_template(color: int, prefix: str) -> str:
+    """Format string of a log line, only the time and the text are left to fill in."""
+    escape = _escape(color)
+    prefix = prefix.replace("{", "{{").replace("}", "}}")
+    arrow = " -> " if prefix == "<" else ""
+    return (
+        f"{escape}[{RESET}{{}}{escape}]{RESET} "
+        f"{escape}[{RESET}{prefix}{escape}]{RESET} "
+        f"{escape}{{}}{arrow}{RESET}"
+    )
+
+
+def _now() -> str:
+    # Log lines of the same second share one strftime call.
+    global _clock
+
+    second = int(time.time())
+    if _clock[0] != second:
+        _clock = (second, time.strftime("%H:%M:%S", time.localtime(second)))
+    return _clock[1]
+
+
 def colorize(text: str, *, color: int) -> str:
     """
     Returns text colored in 0xRRGGBB format.
@@ -52,8 +86,7 @@ def colorize(text: str, *, color: int) -> str:
         str
             Color text using ANSI codes.
     """
-    r, g, b = hex_to_rgb(color)
-    return f"\033[38;2;{r};{g};{b}m{text}\033[0m"
+    return f"{_escape(color)}{text}{RESET}"
 
 
 def log_colorize(text: str, *, color: int, prefix: str) -> str:  # noqa
@@ -75,14 +108,10 @@ def log_colorize(text: str, *, color: int, prefix: str) -> str:  # noqa
     -------
         str
     """
-    _t = datetime.now().strftime("%H:%M:%S")
-    return (
-        f"{colorize("[", color=color)}{_t}{colorize("]", color=color)} "
-        f"{colorize("[", color=color)}{prefix}{colorize("]", color=color)} "
-        f"{colorize(text + (" -> " if prefix == "<" else ""), color=color)}"
-    )
+    return _log_template(color, prefix).format(_now(), text)
 
 
+@lru_cache(maxsize=64)
 def gradient_colorize(text: str, *, start_color: int, end_color: int) -> str:
     """
     Returns text colored with a linear gradient.
@@ -102,21 +131,36 @@ def gradient_colorize(text: str, *, start_color: int, end_color: int) -> str:
     -------
         str
             Text with a gradient applied using ANSI codes.
+
+    Notes
+    -----
+        Rendered texts are cached. A run of characters of the same color, or of
+        whitespace, shares a single escape sequence, so the output stays a few
+        times longer than the text instead of twenty.
     """
+    if not text:
+        return ""
+
     start_rgb = hex_to_rgb(start_color)
     end_rgb = hex_to_rgb(end_color)
 
     # Calculate the number of steps based on the length of the text
-    steps = len(text)
+    steps = max(len(text) - 1, 1)
     gradient_text = []
+    current = None
 
     for i, char in enumerate(text):
-        r = int(start_rgb[0] + (end_rgb[0] - start_rgb[0]) * (i / (steps - 1)))
-        g = int(start_rgb[1] + (end_rgb[1] - start_rgb[1]) * (i / (steps - 1)))
-        b = int(start_rgb[2] + (end_rgb[2] - start_rgb[2]) * (i / (steps - 1)))
+        if char.isspace() and current is not None:
+            gradient_text.append(char)
+            continue
 
-        gradient_text.append(f"\033[38;2;{r};{g};{b}m{char}\033[0m")
+        color = tuple(int(start + (end - start) * (i / steps)) for start, end in zip(start_rgb, end_rgb))
+        if color != current:
+            current = color
+            gradient_text.append("\033[38;2;%d;%d;%dm" % color)
+        gradient_text.append(char)
 
+    gradient_text.append(RESET)
     return ''.join(gradient_text)
 
 
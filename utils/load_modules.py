@@ -1,18 +1,30 @@
 from __future__ import annotations
 
-import importlib.machinery
+import ast
+import importlib.util
+import json
 import os
+import sys
+from dataclasses import dataclass
 from types import ModuleType
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Final
+
+from .storage.cache import CACHE_DIRECTORY
 
 if TYPE_CHECKING:
     from .abc import BaseModule
 
 __all__ = [
+    "MANIFEST_PATH",
+    "ModuleLoadingError",
+    "ModuleDescriptor",
     "load_module",
     "collect_modules"
 ]
 
+MANIFEST_PATH: Final[str] = os.path.join(CACHE_DIRECTORY, "modules.json")
+MANIFEST_VERSION: Final[int] = 2
+
 
 class ModuleLoadingError(Exception):
     """Custom exception for module loading errors."""
@@ -22,12 +34,30 @@ class DirectoryError(Exception):
     """Custom exception for directory-related errors."""
 
 
-def load_module(module_path: str) -> ModuleType:
+def _module_name(module_path: str, directory: str | None = None) -> str:
+    """Dotted name of the file relative to the parent of ``directory``, e.g. ``modules.network.url``."""
+    if directory is None:
+        return os.path.splitext(os.path.basename(module_path))[0]
+
+    relative_path = os.path.relpath(module_path, os.path.dirname(os.path.abspath(directory)))
+    return os.path.splitext(relative_path)[0].replace(os.sep, ".")
+
+
+def load_module(module_path: str, module_name: str | None = None) -> ModuleType:
     """Loads a module from a file at the given path."""
     try:
-        module_name = os.path.splitext(os.path.basename(module_path))[0]
-        spec = importlib.machinery.SourceFileLoader(module_name, module_path)
-        module = spec.load_module()
+        module_name = module_name or _module_name(module_path)
+        if (module := sys.modules.get(module_name)) is not None and module.__file__ == module_path:
+            return module
+
+        spec = importlib.util.spec_from_file_location(module_name, module_path)
+        module = importlib.util.module_from_spec(spec)
+        sys.modules[module_name] = module
+        try:
+            spec.loader.exec_module(module)
+        except BaseException:
+            del sys.modules[module_name]
+            raise
         return module
     except FileNotFoundError:
         raise ModuleLoadingError(f"File {module_path} not found.")
@@ -39,29 +69,160 @@ def load_module(module_path: str) -> ModuleType:
         raise ModuleLoadingError(f"Unknown error while loading module {module_path}: {_e}")
 
 
-def collect_modules(directory: str) -> dict[str, list[BaseModule]]:
+@dataclass(frozen=True, slots=True)
+class ModuleDescriptor:
+    """
+    Menu entry of a module, read from its source without importing it.
+
+    Parameters
+    ----------
+        name : str
+            Name passed to ``BaseModule`` by the module class.
+
+        command : str
+            Command line name of the module, ``name`` unless the class passes ``command``.
+
+        category : str
+            Folder of the module relative to the modules directory.
+
+        path : str
+            Source file of the module.
+
+        module_name : str
+            Name the file is imported under.
+
+        entry_point : str
+            Function of the file returning the module instance.
+    """
+    name: str
+    command: str
+    category: str
+    path: str
+    module_name: str
+    entry_point: str = "load"
+
+    def load(self) -> BaseModule:
+        """Imports the module file and returns a new instance of the module."""
+        module = load_module(self.path, self.module_name)
+        try:
+            return getattr(module, self.entry_point)()
+        except Exception as _e:
+            raise ModuleLoadingError(f"Error calling {self.entry_point}() in module {self.path}: {_e}")
+
+
+def _inspect_source(file_path: str) -> tuple[str, str] | None:
+    """
+    Returns the name and command of the module created by the ``load()`` entry point of the file.
+
+    Statically resolves ``def load(): return SomeClass()`` against
+    ``class SomeClass(..., name="...")``. Returns ``None`` when there is no
+    entry point and raises ``LookupError`` when it cannot be resolved.
+    """
+    with open(file_path, "rb") as file:
+        tree = ast.parse(file.read(), filename=file_path)
+
+    names = {}
+    entry_point = None
+    for node in tree.body:
+        if isinstance(node, ast.ClassDef):
+            keywords = {
+                keyword.arg: keyword.value.value
+                for keyword in node.keywords
+                if isinstance(keyword.value, ast.Constant)
+            }
+            if "name" in keywords:
+                names[node.name] = (keywords["name"], keywords.get("command") or keywords["name"])
+        elif isinstance(node, ast.FunctionDef) and node.name == "load":
+            entry_point = node
+
+    if entry_point is None:
+        return None
+
+    for node in ast.walk(entry_point):
+        if (
+                isinstance(node, ast.Return)
+                and isinstance(node.value, ast.Call)
+                and isinstance(node.value.func, ast.Name)
+                and node.value.func.id in names
+        ):
+            return names[node.value.func.id]
+
+    raise LookupError(f"Cannot resolve the module returned by load() in {file_path}")
+
+
+def _read_manifest(path: str) -> dict[str, dict]:
+    try:
+        with open(path, encoding="UTF-8") as file:
+            manifest = json.load(file)
+    except (OSError, json.JSONDecodeError):
+        return {}
+
+    if manifest.get("version") != MANIFEST_VERSION:
+        return {}
+    return manifest.get("files", {})
+
+
+def _write_manifest(path: str, files: dict[str, dict]) -> None:
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        temporary_path = f"{path}.tmp"
+        with open(temporary_path, encoding="UTF-8", mode="w") as file:
+            json.dump({"version": MANIFEST_VERSION, "files": files}, file)
+        os.replace(temporary_path, path)
+    except OSError:
+        pass
+
+
+def collect_modules(directory: str, manifest_path: str = MANIFEST_PATH) -> dict[str, list[ModuleDescriptor]]:
+    """
+    Discovers modules without importing them.
+
+    Module names come from a manifest of the module sources, cached on disk
+    and refreshed for files whose modification time or size changed. A file is
+    imported during discovery only when its entry point cannot be resolved from
+    the source, otherwise only once the module is selected.
+    """
     modules_dict = {}
+    cached_files = _read_manifest(manifest_path)
+    files = {}
 
     try:
         for folder_path, _, filenames in os.walk(directory):
             module_list = []
+            relative_folder = os.path.relpath(folder_path, directory)
 
             for filename in filenames:
                 if filename.endswith(".py"):
-                    file_path = os.path.join(folder_path, filename)
-                    module = load_module(file_path)
-
-                    if module is not None:
-                        if hasattr(module, 'load'):
-                            try:
-                                module_list.append(module.load())
-                            except Exception as _e:
-                                raise ModuleLoadingError(f"Error calling load() in module {filename}: {_e}")
+                    file_path = os.path.abspath(os.path.join(folder_path, filename))
+                    stat = os.stat(file_path)
+                    key = [stat.st_mtime_ns, stat.st_size]
+
+                    entry = cached_files.get(file_path)
+                    if entry is None or entry["key"] != key:
+                        try:
+                            names = _inspect_source(file_path)
+                        except LookupError:
+                            module = load_module(file_path, _module_name(file_path, directory)).load()
+                            names = module.name, module.command
+                        except SyntaxError as _e:
+                            raise ModuleLoadingError(f"Syntax error in file {file_path}: {_e}")
+                        entry = {"key": key, "names": list(names) if names else None}
+                    files[file_path] = entry
+
+                    if entry["names"] is not None:
+                        module_list.append(ModuleDescriptor(
+                            name=entry["names"][0],
+                            command=entry["names"][1],
+                            category=relative_folder,
+                            path=file_path,
+                            module_name=_module_name(file_path, directory)
+                        ))
 
             if module_list:
-                relative_folder = os.path.relpath(folder_path, directory)
                 modules_dict[relative_folder] = module_list
 
+    except ModuleLoadingError:
+        raise
     except FileNotFoundError:
         raise DirectoryError(f"Directory {directory} not found.")
     except PermissionError:
@@ -71,4 +232,7 @@ def collect_modules(directory: str) -> dict[str, list[BaseModule]]:
     except Exception as _e:
         raise DirectoryError(f"Unknown error while collecting modules from {directory}: {_e}")
 
-    return modules_dict
\ No newline at end of file
+    if files != cached_files:
+        _write_manifest(manifest_path, files)
+
+    return modules_dict
@@ -0,0 +1,3 @@
+from .resolver import *
+from .session import *
+from .throttle import *
@@ -0,0 +1,143 @@
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+from typing import Any
+
+__all__ = [
+    "CachedResolver",
+    "get_resolver"
+]
+
+
+class CachedResolver:
+    """
+    Asynchronous DNS resolver with a shared answer cache.
+
+    Positive answers are kept for the TTL of their record set, NXDOMAIN and
+    empty answers for the SOA minimum of the zone, and concurrent queries of
+    the same name and type share a single request.
+
+    Parameters
+    ----------
+        nameservers : list[str] | None
+            Nameservers to query instead of the system configuration.
+
+        port : int
+            Port of the nameservers.
+
+        timeout : float
+            Time limit of a single query in seconds.
+
+        negative_ttl : float
+            Lifetime of a negative answer without an SOA record.
+
+        max_ttl : float
+            Upper bound of any cached lifetime.
+    """
+
+    def __init__(
+            self,
+            *,
+            nameservers: list[str] | None = None,
+            port: int = 53,
+            timeout: float = 5.0,
+            negative_ttl: float = 300,
+            max_ttl: float = 3600
+    ) -> None:
+        import dns.asyncresolver
+
+        self._resolver = dns.asyncresolver.Resolver(configure=nameservers is None)
+        if nameservers is not None:
+            self._resolver.nameservers = nameservers
+            self._resolver.port = port
+        self._resolver.lifetime = timeout
+
+        self.negative_ttl = negative_ttl
+        self.max_ttl = max_ttl
+        self.hits = 0
+        self.misses = 0
+        self.shared = 0
+
+        self._cache: dict[tuple[str, str], tuple[tuple[Any, ...], float]] = {}
+        self._in_flight: dict[tuple[str, str], asyncio.Task] = {}
+
+    async def resolve(self, name: str, rdtype: str) -> tuple[Any, ...]:
+        """
+        Returns the records of ``name``, an empty tuple if there are none.
+
+        Parameters
+        ----------
+            name : str
+                Domain name to query.
+
+            rdtype : str
+                Record type, e.g. ``"MX"``.
+
+        Returns
+        -------
+            tuple[Any, ...]
+                ``dnspython`` rdata objects.
+        """
+        key = (name.lower().rstrip("."), rdtype.upper())
+
+        entry = self._cache.get(key)
+        if entry is not None and entry[1] > time.monotonic():
+            self.hits += 1
+            return entry[0]
+
+        task = self._in_flight.get(key)
+        if task is not None:
+            self.shared += 1
+        else:
+            self.misses += 1
+            task = asyncio.ensure_future(self._query(*key))
+            self._in_flight[key] = task
+            task.add_done_callback(lambda _: self._in_flight.pop(key, None))
+
+        return await asyncio.shield(task)
+
+    async def _query(self, name: str, rdtype: str) -> tuple[Any, ...]:
+        import dns.resolver
+
+        try:
+            answer = await self._resolver.resolve(name, rdtype)
+        except (dns.resolver.NoAnswer, dns.resolver.NXDOMAIN) as e:
+            records, ttl = (), self._negative_ttl(e)
+        else:
+            records, ttl = tuple(answer), answer.rrset.ttl
+
+        self._cache[(name, rdtype)] = (records, time.monotonic() + min(ttl, self.max_ttl))
+        return records
+
+    def _negative_ttl(self, error: Exception) -> float:
+        import dns.rdatatype
+
+        try:
+            responses = error.responses().values() if hasattr(error, "responses") else [error.response()]
+        except Exception:  # noqa
+            return self.negative_ttl
+
+        for response in responses:
+            for rrset in response.authority:
+                if rrset.rdtype == dns.rdatatype.SOA:
+                    return min(rrset.ttl, rrset[0].minimum)
+        return self.negative_ttl
+
+    def clear(self) -> None:
+        self._cache.clear()
+
+
+_resolver: CachedResolver | None = None
+_resolver_lock = threading.Lock()
+
+
+def get_resolver() -> CachedResolver:
+    """Returns the shared resolver, created on first use."""
+    global _resolver
+
+    with _resolver_lock:
+        if _resolver is None:
+            _resolver = CachedResolver()
+        return _resolver
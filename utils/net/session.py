@@ -0,0 +1,108 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+from requests import Response, Session
+
+if TYPE_CHECKING:
+    from aiohttp import ClientResponse, ClientSession
+
+__all__ = [
+    "TimeoutSession",
+    "create_session",
+    "read_prefix"
+]
+
+
+class TimeoutSession(Session):
+    """
+    ``requests.Session`` applying a default timeout to every request.
+
+    Parameters
+    ----------
+        timeout : float
+            Timeout in seconds used when a request does not pass its own.
+    """
+
+    def __init__(self, timeout: float = 10) -> None:
+        super().__init__()
+        self.timeout = timeout
+
+    def request(self, method: str, url: str, *args: Any, **kwargs: Any) -> Response:
+        kwargs.setdefault("timeout", self.timeout)
+        return super().request(method, url, *args, **kwargs)
+
+
+def create_session(
+        *,
+        limit: int = 64,
+        limit_per_host: int = 4,
+        timeout: float = 10,
+        headers: dict[str, str] | None = None
+) -> ClientSession:
+    """
+    Creates a keep-alive ``aiohttp`` session with bounded connection pool.
+
+    Parameters
+    ----------
+        limit : int
+            Total number of simultaneous connections in the pool.
+
+        limit_per_host : int
+            Number of simultaneous connections to the same host.
+
+        timeout : float
+            Total timeout of a single request in seconds.
+
+        headers : dict[str, str] | None
+            Default headers sent with every request.
+
+    Returns
+    -------
+        ClientSession
+            Must be closed by the caller, preferably with ``async with``.
+    """
+    import aiohttp
+
+    connector = aiohttp.TCPConnector(
+        limit=limit,
+        limit_per_host=limit_per_host,
+        ttl_dns_cache=300
+    )
+    return aiohttp.ClientSession(
+        connector=connector,
+        timeout=aiohttp.ClientTimeout(total=timeout),
+        headers=headers
+    )
+
+
+async def read_prefix(response: ClientResponse, limit: int) -> bytes:
+    """
+    Reads at most ``limit`` bytes of the response body.
+
+    If the body is longer, the connection is closed right away instead of
+    draining the rest of the body into the pool.
+
+    Parameters
+    ----------
+        response : ClientResponse
+            Response with an unread body.
+
+        limit : int
+            Maximum number of bytes to read.
+
+    Returns
+    -------
+        bytes
+    """
+    body = bytearray()
+    while len(body) < limit:
+        chunk = await response.content.read(limit - len(body))
+        if not chunk:
+            break
+        body += chunk
+
+    if not response.content.at_eof():
+        response.close()
+
+    return bytes(body)
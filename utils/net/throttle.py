@@ -0,0 +1,121 @@
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+from collections import defaultdict
+from contextlib import asynccontextmanager
+from typing import AsyncIterator
+
+__all__ = [
+    "RateLimiter",
+    "HostThrottle",
+    "KeyedThrottle"
+]
+
+
+class RateLimiter:
+    """
+    Token bucket limiting the number of operations per second.
+
+    Parameters
+    ----------
+        rate : float
+            Allowed operations per second, ``0`` disables the limit.
+
+        burst : int
+            Number of operations allowed at once after a quiet period.
+    """
+
+    def __init__(self, rate: float, *, burst: int = 1) -> None:
+        self.rate = rate
+        self.burst = max(1, burst)
+        self._tokens = float(self.burst)
+        self._updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self) -> None:
+        if self.rate <= 0:
+            return
+
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+
+                await asyncio.sleep((1 - self._tokens) / self.rate)
+
+
+class HostThrottle:
+    """
+    Per-host fairness: bounds concurrent requests to one host and spaces their starts.
+
+    Parameters
+    ----------
+        concurrency : int
+            Maximum number of simultaneous requests to a single host.
+
+        delay : float
+            Minimum number of seconds between two request starts to the same host.
+
+    Example
+    -------
+        >>> throttle = HostThrottle(concurrency=2, delay=0.5)
+        >>> async with throttle.slot("github.com"):
+        ...     ...
+    """
+
+    def __init__(self, *, concurrency: int = 4, delay: float = 0.0) -> None:
+        self.concurrency = concurrency
+        self.delay = delay
+        self._semaphores: defaultdict[str, asyncio.Semaphore] = defaultdict(
+            lambda: asyncio.Semaphore(self.concurrency)
+        )
+        self._next_start: dict[str, float] = {}
+
+    @asynccontextmanager
+    async def slot(self, host: str) -> AsyncIterator[None]:
+        async with self._semaphores[host]:
+            if self.delay > 0:
+                now = time.monotonic()
+                start = max(now, self._next_start.get(host, now))
+                self._next_start[host] = start + self.delay
+                if start > now:
+                    await asyncio.sleep(start - now)
+
+            yield
+
+
+class KeyedThrottle:
+    """
+    Thread-safe spacing of blocking calls that share a key.
+
+    Parameters
+    ----------
+        delay : float
+            Default minimum number of seconds between two calls with the same key.
+    """
+
+    def __init__(self, *, delay: float = 0.0) -> None:
+        self.delay = delay
+        self._next_start: dict[str, float] = {}
+        self._lock = threading.Lock()
+
+    def wait(self, key: str, delay: float | None = None) -> None:
+        """Blocks until a call with ``key`` may start."""
+        delay = self.delay if delay is None else delay
+        if delay <= 0:
+            return
+
+        with self._lock:
+            now = time.monotonic()
+            start = max(now, self._next_start.get(key, now))
+            self._next_start[key] = start + delay
+
+        if start > now:
+            time.sleep(start - now)
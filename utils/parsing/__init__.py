@@ -0,0 +1,5 @@
+from .address import *
+from .links import *
+from .matcher import *
+from .page import *
+from .urls import *
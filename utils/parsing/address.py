@@ -0,0 +1,142 @@
+from __future__ import annotations
+
+import os
+from dataclasses import dataclass
+from functools import cache
+from typing import Final
+
+__all__ = [
+    "PUBLIC_SUFFIX_LIST",
+    "EmailAddress",
+    "parse_email_address",
+    "split_domain"
+]
+
+PUBLIC_SUFFIX_LIST: Final[str] = os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), "..", "..", "data", "public_suffix_list.dat"
+)
+
+
+@dataclass(frozen=True, slots=True)
+class _SuffixTable:
+    rules: frozenset[str]
+    wildcards: frozenset[str]
+    exceptions: frozenset[str]
+
+
+@cache
+def _load_suffixes(path: str = PUBLIC_SUFFIX_LIST) -> _SuffixTable:
+    rules, wildcards, exceptions = set(), set(), set()
+
+    with open(path, encoding="UTF-8") as file:
+        for line in file:
+            rule = line.strip()
+            if not rule or rule.startswith("//"):
+                continue
+
+            match rule[0]:
+                case "!":
+                    target, rule = exceptions, rule[1:]
+                case "*":
+                    target, rule = wildcards, rule[2:]
+                case _:
+                    target = rules
+
+            target.add(rule)
+            if not rule.isascii():
+                # Mail domains arrive in punycode, keep both spellings.
+                try:
+                    target.add(rule.encode("idna").decode("ascii"))
+                except UnicodeError:
+                    pass
+
+    return _SuffixTable(frozenset(rules), frozenset(wildcards), frozenset(exceptions))
+
+
+def split_domain(domain: str) -> tuple[str | None, str]:
+    """
+    Splits a lowercase domain into its registrable domain and public suffix.
+
+    Candidates are tried from the longest to the shortest by walking the dots
+    once, following the Public Suffix List algorithm.
+
+    Returns
+    -------
+        tuple[str | None, str]
+            Registrable domain, ``None`` if the domain is a public suffix itself, and the suffix.
+
+    Example
+    -------
+        >>> split_domain("mail.example.co.uk")
+        ('example.co.uk', 'co.uk')
+    """
+    table = _load_suffixes()
+    starts = [0]
+    starts.extend(index + 1 for index, char in enumerate(domain) if char == ".")
+
+    suffix_index = len(starts) - 1
+    for index, start in enumerate(starts):
+        candidate = domain[start:]
+        if candidate in table.exceptions:
+            suffix_index = index + 1
+            break
+        if candidate in table.rules or (
+                index + 1 < len(starts) and domain[starts[index + 1]:] in table.wildcards
+        ):
+            suffix_index = index
+            break
+
+    suffix = domain[starts[suffix_index]:]
+    if suffix_index == 0:
+        return None, suffix
+    return domain[starts[suffix_index - 1]:], suffix
+
+
+@dataclass(frozen=True, slots=True)
+class EmailAddress:
+    """
+    Parsed email address.
+
+    Attributes
+    ----------
+        local : str
+            Part before the last ``@``.
+
+        domain : str
+            Full mail domain, lowercased, e.g. ``mail.example.co.uk``.
+
+        registrable : str | None
+            Domain registered under the public suffix, e.g. ``example.co.uk``.
+
+        suffix : str
+            Public suffix, e.g. ``co.uk``.
+    """
+    local: str
+    domain: str
+    registrable: str | None
+    suffix: str
+
+    @property
+    def label(self) -> str | None:
+        """Registrable domain without its suffix, e.g. ``example``."""
+        if self.registrable is None:
+            return None
+        return self.registrable[:-len(self.suffix) - 1]
+
+
+def parse_email_address(email: str) -> EmailAddress | None:
+    """
+    Parses an email address, returns ``None`` if it has no domain.
+
+    Example
+    -------
+        >>> parse_email_address("a@Mail.Example.co.uk")
+        EmailAddress(local='a', domain='mail.example.co.uk', registrable='example.co.uk', suffix='co.uk')
+    """
+    local, at, domain = email.strip().rpartition("@")
+    domain = domain.rstrip(".").lower()
+    if not at or not domain:
+        return None
+
+    registrable, suffix = split_domain(domain)
+    return EmailAddress(local=local, domain=domain, registrable=registrable, suffix=suffix)
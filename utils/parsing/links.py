@@ -0,0 +1,87 @@
+from __future__ import annotations
+
+import codecs
+import re
+from html.parser import HTMLParser
+
+__all__ = [
+    "LinkExtractor"
+]
+
+# Quotes and brackets end a URL inside a JavaScript string or template.
+_SCRIPT_URL_PATTERN = re.compile(r'(https?://[^\s"\'`<>\\]+)')
+
+
+class LinkExtractor(HTMLParser):
+    """
+    Event-based extractor of raw links from an HTML page.
+
+    Collects ``href``, ``src`` and ``action`` attributes of linking tags and
+    absolute URLs found in inline scripts, without building a DOM. The page is
+    fed in chunks of bytes or text and every call returns the links completed
+    so far, so a caller can stop reading a huge page at any moment.
+
+    Parameters
+    ----------
+        encoding : str | None
+            Encoding of byte chunks, UTF-8 if unknown.
+
+    Example
+    -------
+        >>> extractor = LinkExtractor("utf-8")
+        >>> extractor.feed(b'<a href="/about">About</a>')
+        ['/about']
+    """
+
+    LINK_TAGS = frozenset({"a", "link", "script", "img", "iframe", "button", "form"})
+    LINK_ATTRIBUTES = frozenset({"href", "src", "action"})
+
+    def __init__(self, encoding: str | None = None) -> None:
+        super().__init__(convert_charrefs=True)
+        try:
+            decoder = codecs.getincrementaldecoder(encoding or "utf-8")
+        except LookupError:
+            decoder = codecs.getincrementaldecoder("utf-8")
+        self._decoder = decoder(errors="replace")
+        self._links: list[str] = []
+        self._script_parts: list[str] | None = None
+
+    def handle_starttag(self, tag: str, attrs: list[tuple[str, str | None]]) -> None:
+        if tag not in self.LINK_TAGS:
+            return
+
+        # Like BeautifulSoup, the last of duplicated attributes wins.
+        for name, value in dict(attrs).items():
+            if name in self.LINK_ATTRIBUTES and value:
+                self._links.append(value)
+
+        if tag == "script":
+            self._script_parts = []
+
+    def handle_endtag(self, tag: str) -> None:
+        if tag == "script" and self._script_parts is not None:
+            self._links.extend(_SCRIPT_URL_PATTERN.findall("".join(self._script_parts)))
+            self._script_parts = None
+
+    def handle_data(self, data: str) -> None:
+        if self._script_parts is not None:
+            self._script_parts.append(data)
+
+    def _drain(self) -> list[str]:
+        links, self._links = self._links, []
+        return links
+
+    def feed(self, data: bytes | str) -> list[str]:
+        """Feeds the next chunk of the page and returns the links found in it."""
+        if isinstance(data, bytes):
+            data = self._decoder.decode(data)
+        super().feed(data)
+        return self._drain()
+
+    def close(self) -> list[str]:
+        """Flushes buffered input and returns the remaining links."""
+        super().feed(self._decoder.decode(b"", final=True))
+        super().close()
+        if self._script_parts is not None:
+            self.handle_endtag("script")
+        return self._drain()
@@ -0,0 +1,55 @@
+from __future__ import annotations
+
+from functools import lru_cache
+from typing import Iterable
+
+__all__ = [
+    "IndicatorMatcher",
+    "compile_indicators"
+]
+
+
+class IndicatorMatcher:
+    """
+    Case-insensitive matcher for a fixed set of text indicators.
+
+    Indicators are lowercased and deduplicated once, so a search over an
+    already lowercased buffer does no allocation at all.
+
+    Parameters
+    ----------
+        indicators : Iterable[str]
+            Substrings to look for.
+    """
+
+    __slots__ = ("indicators",)
+
+    def __init__(self, indicators: Iterable[str]) -> None:
+        # CPython substring search outperforms an equivalent ``re`` alternation
+        # by several times at any indicator count, so keep plain needles.
+        self.indicators: tuple[str, ...] = tuple(dict.fromkeys(
+            indicator.lower() for indicator in indicators if indicator
+        ))
+
+    def search(self, lowered: str) -> str | None:
+        """
+        Returns the first indicator found in the lowercased text.
+
+        Example
+        -------
+            >>> IndicatorMatcher(["User Not Found"]).search("<p>user not found</p>")
+            'user not found'
+        """
+        for indicator in self.indicators:
+            if indicator in lowered:
+                return indicator
+        return None
+
+    def __len__(self) -> int:
+        return len(self.indicators)
+
+
+@lru_cache(maxsize=512)
+def compile_indicators(*groups: tuple[str, ...]) -> IndicatorMatcher:
+    """Returns a cached matcher for the union of the given indicator groups."""
+    return IndicatorMatcher(indicator for group in groups for indicator in group)
@@ -0,0 +1,118 @@
+from __future__ import annotations
+
+import re
+from functools import cached_property
+from html.parser import HTMLParser
+
+__all__ = [
+    "TextExtractor",
+    "PageAnalysis"
+]
+
+_TAG_PATTERN = re.compile(r'<[^>]*>')
+
+
+class TextExtractor(HTMLParser):
+    """
+    Event-based extractor of the page title and visible text.
+
+    Works without building a DOM and can be fed in chunks. Mirrors
+    ``BeautifulSoup.get_text()``: script, style and template contents are skipped.
+    """
+
+    _HIDDEN_TAGS = frozenset({"script", "style", "template"})
+
+    def __init__(self) -> None:
+        super().__init__(convert_charrefs=True)
+        self.title: str | None = None
+        self._title_parts: list[str] | None = None
+        self._text_parts: list[str] = []
+        self._hidden_depth = 0
+
+    def handle_starttag(self, tag: str, attrs: list[tuple[str, str | None]]) -> None:
+        if tag in self._HIDDEN_TAGS:
+            self._hidden_depth += 1
+        elif tag == "title" and self.title is None:
+            self._title_parts = []
+
+    def handle_endtag(self, tag: str) -> None:
+        if tag in self._HIDDEN_TAGS:
+            self._hidden_depth = max(0, self._hidden_depth - 1)
+        elif tag == "title" and self._title_parts is not None:
+            self.title = "".join(self._title_parts)
+            self._title_parts = None
+
+    def handle_data(self, data: str) -> None:
+        if self._hidden_depth:
+            return
+
+        if self._title_parts is not None:
+            self._title_parts.append(data)
+        self._text_parts.append(data)
+
+    @property
+    def text(self) -> str:
+        return "".join(self._text_parts)
+
+
+class PageAnalysis:
+    """
+    Single-parse view over an HTML page.
+
+    Every derived representation is computed at most once and shared between
+    callers. The page is tokenized by :class:`TextExtractor` unless ``dom`` is
+    set, in which case one ``BeautifulSoup`` tree is built and reused.
+
+    Parameters
+    ----------
+        html : str
+            Page source.
+
+        dom : bool
+            Build a full DOM instead of streaming the title and text.
+    """
+
+    def __init__(self, html: str, *, dom: bool = False) -> None:
+        self.html = html
+        self.dom = dom
+
+    @cached_property
+    def soup(self):  # noqa
+        from bs4 import BeautifulSoup
+
+        return BeautifulSoup(self.html, "html.parser")
+
+    @cached_property
+    def _extracted(self) -> tuple[str | None, str]:
+        if self.dom:
+            title = self.soup.title.string if self.soup.title else None
+            return title, self.soup.get_text()
+
+        extractor = TextExtractor()
+        extractor.feed(self.html)
+        extractor.close()
+        return extractor.title, extractor.text
+
+    @property
+    def title(self) -> str | None:
+        """Title of the page or ``None`` when there is no title tag."""
+        return self._extracted[0]
+
+    @cached_property
+    def title_lower(self) -> str:
+        return (self.title or "").strip().lower()
+
+    @cached_property
+    def text_lower(self) -> str:
+        """Visible text of the page, lowercased."""
+        return self._extracted[1].lower()
+
+    @cached_property
+    def lower(self) -> str:
+        """Raw page source, lowercased."""
+        return self.html.lower()
+
+    @cached_property
+    def stripped(self) -> str:
+        """Lowercased page source with every tag removed."""
+        return _TAG_PATTERN.sub('', self.lower)
@@ -0,0 +1,76 @@
+from __future__ import annotations
+
+from functools import lru_cache
+from typing import Final
+from urllib.parse import SplitResult, urljoin, urlsplit
+
+__all__ = [
+    "DEFAULT_PORTS",
+    "canonicalize_url",
+    "host_in_scope"
+]
+
+DEFAULT_PORTS: Final[dict[str, int]] = {"http": 80, "https": 443}
+
+
+def canonicalize_url(url: str, base: str | None = None) -> SplitResult | None:
+    """
+    Resolves a link and brings it to a canonical form.
+
+    The scheme and host are lowercased. Credentials, default ports, fragments
+    and trailing slashes are dropped, so equivalent links compare equal.
+
+    Parameters
+    ----------
+        url : str
+            Absolute or relative link.
+
+        base : str | None
+            URL of the page the link was found on.
+
+    Returns
+    -------
+        SplitResult | None
+            ``None`` for links that are not HTTP(S) or have no valid host.
+
+    Example
+    -------
+        >>> canonicalize_url("../b/#top", "HTTPS://Example.com:443/a/x").geturl()
+        'https://example.com/b'
+    """
+    try:
+        parts = urlsplit(urljoin(base, url) if base else url)
+        port = parts.port
+    except ValueError:
+        return None
+
+    if parts.scheme not in DEFAULT_PORTS or not parts.hostname:
+        return None
+
+    host = parts.hostname.rstrip(".")
+    netloc = f"[{host}]" if ":" in host else host
+    if port is not None and port != DEFAULT_PORTS[parts.scheme]:
+        netloc += f":{port}"
+
+    path = parts.path.rstrip("/") or "/"
+    return SplitResult(parts.scheme, netloc, path, parts.query, "")
+
+
+@lru_cache(maxsize=64)
+def _scope_host(domain: str) -> str:
+    return (urlsplit("//" + domain).hostname or domain).rstrip(".")
+
+
+def host_in_scope(host: str | None, domain: str) -> bool:
+    """
+    Checks that a host is the domain itself or one of its subdomains.
+
+    Unlike a substring test, ``evil.com`` never matches ``example.com`` even if
+    the domain appears in its path or query. A port in ``domain`` is ignored.
+    """
+    if not host:
+        return False
+
+    scope = _scope_host(domain)
+    host = host.rstrip(".")
+    return host == scope or host.endswith("." + scope)
@@ -0,0 +1,4 @@
+from .cache import *
+from .checkpoint import *
+from .crawl import *
+from .visited import *
@@ -0,0 +1,196 @@
+from __future__ import annotations
+
+import atexit
+import json
+import os
+import sqlite3
+import threading
+import time
+from typing import Any, Final
+
+__all__ = [
+    "CACHE_DIRECTORY",
+    "ResultCache",
+    "configure_cache",
+    "get_cache"
+]
+
+CACHE_DIRECTORY: Final[str] = os.path.join(
+    os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache"),
+    "neptune-osint"
+)
+
+
+class ResultCache:
+    """
+    On-disk cache of presence checks keyed by ``(module, site, identifier)``.
+
+    Entries expire after their TTL, and the least recently used entries are
+    evicted once the cache holds more than ``max_entries``. Access times of
+    hits are kept in memory and written with the periodic eviction, so reads
+    never write to the database. Safe to share between threads.
+
+    Parameters
+    ----------
+        path : str
+            SQLite database file, ``":memory:"`` keeps the cache in memory.
+
+        max_entries : int
+            Number of entries kept before LRU eviction.
+
+        ttl : float
+            Default lifetime of an entry in seconds.
+
+        refresh : bool
+            Ignore stored entries on read while still storing new results.
+    """
+
+    _EVICT_EVERY: Final[int] = 256
+
+    def __init__(
+            self,
+            path: str = os.path.join(CACHE_DIRECTORY, "results.sqlite3"),
+            *,
+            max_entries: int = 100_000,
+            ttl: float = 24 * 60 * 60,
+            refresh: bool = False
+    ) -> None:
+        if path != ":memory:":
+            os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+
+        self.path = path
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.refresh = refresh
+        self.hits = 0
+        self.misses = 0
+
+        self._lock = threading.Lock()
+        self._writes = 0
+        self._accessed: dict[tuple[str, str, str], float] = {}
+        self._connection = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self._connection.executescript(
+            """
+            PRAGMA journal_mode = WAL;
+            PRAGMA synchronous = NORMAL;
+            CREATE TABLE IF NOT EXISTS results (
+                module TEXT NOT NULL,
+                site TEXT NOT NULL,
+                identifier TEXT NOT NULL,
+                value TEXT NOT NULL,
+                expires_at REAL NOT NULL,
+                accessed_at REAL NOT NULL,
+                PRIMARY KEY (module, site, identifier)
+            );
+            CREATE INDEX IF NOT EXISTS results_accessed_at ON results (accessed_at);
+            """
+        )
+
+    def get(self, module: str, site: str, identifier: str) -> Any | None:
+        """Returns the cached value or ``None`` on a miss."""
+        if self.refresh:
+            self.misses += 1
+            return None
+
+        now = time.time()
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT value, expires_at FROM results WHERE module = ? AND site = ? AND identifier = ?",
+                (module, site, identifier)
+            ).fetchone()
+
+            if row is None or row[1] <= now:
+                self.misses += 1
+                return None
+
+            self._accessed[(module, site, identifier)] = now
+            self.hits += 1
+
+        return json.loads(row[0])
+
+    def set(self, module: str, site: str, identifier: str, value: Any, *, ttl: float | None = None) -> None:
+        now = time.time()
+        with self._lock:
+            self._connection.execute(
+                "INSERT OR REPLACE INTO results VALUES (?, ?, ?, ?, ?, ?)",
+                (module, site, identifier, json.dumps(value), now + (self.ttl if ttl is None else ttl), now)
+            )
+            self._accessed.pop((module, site, identifier), None)
+            self._writes += 1
+            if self._writes % self._EVICT_EVERY == 0:
+                self._flush()
+                self._evict(now)
+
+    def _flush(self) -> None:
+        if not self._accessed:
+            return
+
+        with self._connection:
+            self._connection.execute("BEGIN")
+            self._connection.executemany(
+                "UPDATE results SET accessed_at = ? WHERE module = ? AND site = ? AND identifier = ?",
+                ((accessed_at, *key) for key, accessed_at in self._accessed.items())
+            )
+        self._accessed.clear()
+
+    def flush(self) -> None:
+        """Writes the access times of the hits since the last eviction."""
+        with self._lock:
+            self._flush()
+
+    def _evict(self, now: float) -> None:
+        self._connection.execute("DELETE FROM results WHERE expires_at <= ?", (now,))
+        (count,) = self._connection.execute("SELECT COUNT(*) FROM results").fetchone()
+        if count > self.max_entries:
+            # Drop a little more than needed so eviction does not run on every write.
+            self._connection.execute(
+                "DELETE FROM results WHERE rowid IN (SELECT rowid FROM results ORDER BY accessed_at LIMIT ?)",
+                (count - int(self.max_entries * 0.9),)
+            )
+
+    def summary(self) -> str:
+        return f"Cache hits: {self.hits}, misses: {self.misses}"
+
+    def reset_stats(self) -> None:
+        self.hits = self.misses = 0
+
+    def close(self) -> None:
+        with self._lock:
+            self._flush()
+            self._connection.close()
+
+
+_cache: ResultCache | None = None
+_cache_options: dict[str, Any] = {}
+_cache_lock = threading.Lock()
+
+
+def configure_cache(**options: Any) -> None:
+    """Sets the options of the shared cache, see :class:`ResultCache`."""
+    global _cache
+
+    with _cache_lock:
+        _cache_options.update(options)
+        if _cache is not None:
+            _cache.close()
+            _cache = None
+
+
+def get_cache() -> ResultCache:
+    """Returns the shared result cache, opening it on first use."""
+    global _cache
+
+    with _cache_lock:
+        if _cache is None:
+            _cache = ResultCache(**_cache_options)
+        return _cache
+
+
+@atexit.register
+def _close_cache() -> None:
+    global _cache
+
+    with _cache_lock:
+        if _cache is not None:
+            _cache.close()
+            _cache = None
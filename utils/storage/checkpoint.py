@@ -0,0 +1,49 @@
+from __future__ import annotations
+
+import json
+import os
+from typing import Any
+
+__all__ = [
+    "Checkpoint"
+]
+
+
+class Checkpoint:
+    """
+    Small JSON state file used to resume interrupted jobs.
+
+    Writes are atomic: the state is written to a temporary file that
+    replaces the previous one, so a crash never leaves a torn checkpoint.
+
+    Parameters
+    ----------
+        path : str
+            Checkpoint file path.
+    """
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+
+    def exists(self) -> bool:
+        return os.path.isfile(self.path)
+
+    def load(self) -> dict[str, Any]:
+        """Returns the saved state or an empty dict when there is none."""
+        try:
+            with open(self.path, encoding="UTF-8") as file:
+                return json.load(file)
+        except (FileNotFoundError, json.JSONDecodeError):
+            return {}
+
+    def save(self, state: dict[str, Any]) -> None:
+        temporary_path = f"{self.path}.tmp"
+        with open(temporary_path, encoding="UTF-8", mode="w") as file:
+            json.dump(state, file)
+        os.replace(temporary_path, self.path)
+
+    def clear(self) -> None:
+        try:
+            os.remove(self.path)
+        except FileNotFoundError:
+            pass
@@ -0,0 +1,170 @@
+from __future__ import annotations
+
+import os
+import queue
+import sqlite3
+import threading
+from hashlib import blake2b
+from typing import TYPE_CHECKING, Final, Iterator
+
+from .cache import CACHE_DIRECTORY
+
+if TYPE_CHECKING:
+    from types import TracebackType
+
+__all__ = [
+    "CrawlState"
+]
+
+
+class CrawlState:
+    """
+    On-disk frontier and visited log of a crawl, used to resume it after an interruption.
+
+    Every discovered link is recorded with the depth it was queued at, or
+    without one if it was seen but not queued, and is marked done once its
+    page is processed. Records are put on a queue and written by a background
+    thread in batched transactions, so the fetch loop never waits on disk.
+    Pages being fetched during a crash are fetched again on resume.
+
+    Parameters
+    ----------
+        path : str
+            SQLite database file.
+
+    Example
+    -------
+        >>> state = CrawlState.for_crawl("https://example.com", "example.com")
+        >>> with state:
+        ...     state.discovered("https://example.com/about", 1)
+        ...     state.visited("https://example.com/about")
+    """
+
+    _BATCH_SIZE: Final[int] = 4096
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+        self._queue: queue.SimpleQueue[tuple[str, int | None] | tuple[str] | None] = queue.SimpleQueue()
+        self._writer: threading.Thread | None = None
+
+    @classmethod
+    def for_crawl(cls, website_url: str, domain: str) -> CrawlState:
+        """State file of a crawl, identified by its root URL and domain."""
+        key = blake2b(f"{website_url}\n{domain}".encode(), digest_size=8).hexdigest()
+        return cls(os.path.join(CACHE_DIRECTORY, "crawls", f"{key}.sqlite3"))
+
+    def _connect(self) -> sqlite3.Connection:
+        connection = sqlite3.connect(self.path, isolation_level=None)
+        connection.executescript(
+            """
+            PRAGMA journal_mode = WAL;
+            PRAGMA synchronous = NORMAL;
+            CREATE TABLE IF NOT EXISTS links (
+                url TEXT PRIMARY KEY,
+                depth INTEGER,
+                done INTEGER NOT NULL DEFAULT 0
+            );
+            """
+        )
+        return connection
+
+    def exists(self) -> bool:
+        return os.path.isfile(self.path)
+
+    def seen(self) -> Iterator[str]:
+        """Yields every recorded link, queued or not."""
+        if not self.exists():
+            return
+
+        connection = self._connect()
+        try:
+            yield from (url for url, in connection.execute("SELECT url FROM links"))
+        finally:
+            connection.close()
+
+    def pending(self) -> list[tuple[str, int]]:
+        """Returns queued links that were not processed, in the order they were queued."""
+        if not self.exists():
+            return []
+
+        connection = self._connect()
+        try:
+            return connection.execute(
+                "SELECT url, depth FROM links WHERE depth IS NOT NULL AND done = 0 ORDER BY rowid"
+            ).fetchall()
+        finally:
+            connection.close()
+
+    def scheduled(self) -> int:
+        """Number of links queued so far."""
+        if not self.exists():
+            return 0
+
+        connection = self._connect()
+        try:
+            return connection.execute("SELECT COUNT(depth) FROM links").fetchone()[0]
+        finally:
+            connection.close()
+
+    def discovered(self, url: str, depth: int | None) -> None:
+        """Records a link, ``depth`` is ``None`` if it was not queued."""
+        self._queue.put((url, depth))
+
+    def visited(self, url: str) -> None:
+        """Marks the page of a link as processed."""
+        self._queue.put((url,))
+
+    def _write(self) -> None:
+        connection = self._connect()
+        running = True
+        while running:
+            batch = [self._queue.get()]
+            while len(batch) < self._BATCH_SIZE:
+                try:
+                    batch.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+
+            connection.execute("BEGIN")
+            for record in batch:
+                if record is None:
+                    running = False
+                elif len(record) == 2:
+                    connection.execute("INSERT OR IGNORE INTO links (url, depth) VALUES (?, ?)", record)
+                else:
+                    connection.execute("UPDATE links SET done = 1 WHERE url = ?", record)
+            connection.execute("COMMIT")
+
+        connection.close()
+
+    def start(self) -> None:
+        if self._writer is not None:
+            return
+
+        os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+        self._writer = threading.Thread(target=self._write, name="crawl-state-writer", daemon=True)
+        self._writer.start()
+
+    def stop(self) -> None:
+        """Writes every queued record and stops the writer."""
+        if self._writer is None:
+            return
+
+        self._queue.put(None)
+        self._writer.join()
+        self._writer = None
+
+    def clear(self) -> None:
+        self.stop()
+        for suffix in ("", "-wal", "-shm"):
+            try:
+                os.remove(self.path + suffix)
+            except FileNotFoundError:
+                pass
+
+    def __enter__(self) -> CrawlState:
+        self.start()
+        return self
+
+    def __exit__(self, exc_type: type, exc_val: Exception, exc_tb: 'TracebackType') -> None:
+        self.stop()